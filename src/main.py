@@ -6,67 +6,131 @@ from fastapi.responses import HTMLResponse, StreamingResponse
 from pydantic import BaseModel
 import os
 import asyncio
+import logging
+import logging.handlers
+import queue
 import time
-import json
+import orjson
+import httpx
 from dotenv import load_dotenv
 from services.patent_service import PatentService
-from services.openai_service import OpenAIService
+from services.openai_service import OpenAIService, close_default_openai_service, set_default_openai_service
 from services.cache_service import CacheService
+from services.semantic_cache import SemanticCache
+from utils import best_name_match, clean_inventors, is_placeholder_name
 from services.linkedin_playwright_search import LinkedInPlaywrightSearchService
+from services.linkedin_service import clear_profile_cache
+from models.patent import PatentView
 from models.contact import ContactAnalysisRequest, ContactAnalysisResponse, ContactLead, InventorContact
 from typing import Optional, List, Dict
-import pandas as pd
+import xlsxwriter
 from io import BytesIO
+from contextlib import asynccontextmanager
 
 load_dotenv()
 
-app = FastAPI(title="Patent Research Agent", version="1.0.0")
-
-# Serve static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
+logger = logging.getLogger(__name__)
 
 # Global services for efficiency
 patent_service_context = None
 cache_service = None
 openai_service = None
 linkedin_search_service = None
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services on startup"""
-    global patent_service_context, cache_service, openai_service, linkedin_search_service
-
-    # 1. Initialize OpenAI Service first
+semantic_cache = None
+http_client = None
+
+# LinkedIn lookups keyed by (name, patent title) -> (expires_at, url_or_none).
+# "Not found" results are cached too, but expire sooner than hits.
+LINKEDIN_FOUND_TTL = 7 * 24 * 3600
+LINKEDIN_NOT_FOUND_TTL = 24 * 3600
+# Bounds the cache on long-running servers; expired entries are dropped first
+LINKEDIN_URL_CACHE_SIZE = 4096
+linkedin_url_cache: Dict[tuple, tuple] = {}
+
+def _configure_logging() -> logging.handlers.QueueListener:
+    """Send log records through a queue so slow console writes never block the event loop"""
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    listener = logging.handlers.QueueListener(log_queue, console)
+    listener.start()
+    return listener
+
+def _init_openai_service(client: httpx.AsyncClient) -> Optional[OpenAIService]:
     try:
-        openai_service = OpenAIService()
+        service = OpenAIService(http_client=client)
         print("✓ OpenAI Service Initialized.")
+        return service
     except ValueError as e:
-        openai_service = None
         print(f"⚠️ WARNING: OpenAI Service failed to initialize: {e}")
+        return None
+
+async def _init_patent_service(client: httpx.AsyncClient) -> PatentService:
+    service = PatentService(http_client=client)
+    await service.__aenter__()
+    return service
 
-    # 2. Initialize Patent Service (which includes browser context)
-    patent_service_context = PatentService()
-    await patent_service_context.__aenter__()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize services on startup and clean them up on shutdown"""
+    global patent_service_context, cache_service, openai_service, linkedin_search_service, semantic_cache, http_client
+
+    log_listener = _configure_logging()
+
+    # One keep-alive connection pool for all outbound API calls
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+        timeout=httpx.Timeout(60.0)
+    )
+
+    # 1. Bring up the OpenAI client and the Patent Service (browser launch) in parallel
+    async with asyncio.TaskGroup() as tg:
+        openai_task = tg.create_task(asyncio.to_thread(_init_openai_service, http_client))
+        patent_task = tg.create_task(_init_patent_service(http_client))
+    openai_service = openai_task.result()
+    set_default_openai_service(openai_service)
+    patent_service_context = patent_task.result()
     cache_service = CacheService()
+
+    # Semantic cache collapses near-duplicate analysis prompts; a threshold >= 1 disables it
+    semantic_threshold = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.93"))
+    if openai_service and semantic_threshold < 1:
+        semantic_cache = SemanticCache(openai_service.embed_texts, threshold=semantic_threshold)
     
-    # 3. Initialize LinkedIn Search Service, passing the other services to it
+    # 2. Initialize LinkedIn Search Service, which depends on both of the above
     linkedin_search_service = LinkedInPlaywrightSearchService(
-        browser_context=patent_service_context.context,
+        browser_pool=patent_service_context.pool,
         openai_service=openai_service
     )
     await linkedin_search_service.__aenter__()
     
     print("✓ Patent Research Agent started")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup services on shutdown"""
-    global patent_service_context, linkedin_search_service
-    if linkedin_search_service:
+    try:
+        yield
+    finally:
         await linkedin_search_service.__aexit__(None, None, None)
-    if patent_service_context:
         await patent_service_context.__aexit__(None, None, None)
-    print("✓ Services cleaned up")
+        # Closes the fallback service's own pool if one was created; ours goes with http_client
+        await close_default_openai_service()
+        await http_client.aclose()
+        print("✓ Services cleaned up")
+        log_listener.stop()
+
+app = FastAPI(title="Patent Research Agent", version="1.0.0", lifespan=lifespan)
+
+# Serve static files
+app.mount("/static", StaticFiles(directory="static"), name="static")
+
+async def aget_ai_analysis(inventor_name: str, patent_number: str) -> Optional[Dict]:
+    """Read a cached AI analysis without blocking the event loop on cache I/O"""
+    return await asyncio.to_thread(cache_service.get_ai_analysis, inventor_name, patent_number)
+
+async def aset_ai_analysis(inventor_name: str, patent_number: str, analysis: Dict) -> None:
+    """Write an AI analysis to the cache without blocking the event loop on cache I/O"""
+    await asyncio.to_thread(cache_service.set_ai_analysis, inventor_name, patent_number, analysis)
 
 class PatentRequest(BaseModel):
     patent_number: str
@@ -79,6 +143,11 @@ class InventorAnalysisRequest(BaseModel):
     patent_number: str
     patent_title: str
 
+class InventorBatchAnalysisRequest(BaseModel):
+    patent_number: str
+    patent_title: str
+    inventor_names: List[str]
+
 class InventorInfo(BaseModel):
     name: str
     email: str | None = None
@@ -126,46 +195,47 @@ async def research_patent(request: PatentRequest, analyze_contacts: bool = False
         if not request.patent_number.strip():
             raise HTTPException(status_code=400, detail="Patent number cannot be empty")
         
-        patent_data = await patent_service_context.extract_patent_data(request.patent_number)
+        patent = PatentView.from_dict(await patent_service_context.extract_patent_data(request.patent_number))
         
         inventors_info = []
-        if analyze_contacts and openai_service and patent_data.get('source') != 'mock_data':
+        if analyze_contacts and openai_service and patent.source != 'mock_data':
             # Perform contact analysis
             analysis_data = {
-                'patent_number': patent_data.get('patent_number'),
-                'title': patent_data.get('title'),
-                'inventors': patent_data.get('inventors', []),
-                'assignee': patent_data.get('assignee')
+                'patent_number': patent.patent_number,
+                'title': patent.title,
+                'inventors': patent.inventors,
+                'assignee': patent.assignee
             }
             contact_analysis = await openai_service.analyze_inventor_contacts(analysis_data)
             
             # Create a map of inventor names to their analysis
             analysis_map = {item['name']: item for item in contact_analysis.get('inventors', [])}
 
-            for inventor_name in patent_data.get('inventors', []):
+            for inventor_name in patent.inventors:
                 lead_data = analysis_map.get(inventor_name)
+                # The LLM output is untrusted, so only the ContactLead is validated
                 contact_lead = ContactLead(**lead_data) if lead_data else None
-                inventors_info.append(InventorInfo(
+                inventors_info.append(InventorInfo.model_construct(
                     name=inventor_name,
                     confidence_score=contact_lead.confidence_score if contact_lead else 0.0,
                     contact_lead=contact_lead
                 ))
         else:
             # Basic info without contact analysis
-            for inventor_name in patent_data.get('inventors', []):
-                inventors_info.append(InventorInfo(
-                    name=inventor_name,
-                    confidence_score=0.8 if patent_data.get('source') == 'uspto_playwright' else 0.5
-                ))
+            score = 0.8 if patent.source in ('uspto_playwright', 'patentsview_api') else 0.5
+            inventors_info = [
+                InventorInfo.model_construct(name=inventor_name, confidence_score=score)
+                for inventor_name in patent.inventors
+            ]
 
         processing_time = time.time() - start_time
         
         return PatentResponse(
             patent_number=request.patent_number,
-            title=patent_data.get('title', 'Unknown Title'),
+            title=patent.title,
             inventors=inventors_info,
             processing_time=round(processing_time, 2),
-            source=patent_data.get('source', 'unknown')
+            source=patent.source
         )
         
     except Exception as e:
@@ -180,69 +250,167 @@ async def research_patent(request: PatentRequest, analyze_contacts: bool = False
             source="error"
         )
 
+SSE_PREFIX = b"data: "
+SSE_SUFFIX = b"\n\n"
+
+def sse_event(event: Dict) -> bytes:
+    """Format one Server-Sent Event as UTF-8 bytes, serialized with orjson"""
+    return SSE_PREFIX + orjson.dumps(event) + SSE_SUFFIX
+
 @app.post("/research-multiple")
 async def research_multiple_patents(request: MultiplePatentsRequest):
     """Research multiple patents with real-time updates via SSE"""
     
-    async def generate_updates():
-        """Generate SSE updates for patent processing"""
-        for i, patent_number in enumerate(request.patent_numbers):
+    # Bound how many patents are extracted at once; each holds a Playwright page
+    semaphore = asyncio.Semaphore(int(os.getenv("PATENT_CONCURRENCY", "6")))
+
+    async def process_patent(i: int, patent_number: str):
+        """Extract a single patent and build its table row (runs concurrently)"""
+        async with semaphore:
             try:
-                # Send status update
-                yield f"data: {json.dumps({'type': 'status', 'patent': patent_number, 'message': 'Processing...', 'index': i})}\n\n"
-                
-                # Process patent
                 start_time = time.time()
-                patent_data = await patent_service_context.extract_patent_data(patent_number)
+                patent = PatentView.from_dict(await patent_service_context.extract_patent_data(patent_number))
                 processing_time = time.time() - start_time
                 
-                # Create table row data
-                inventors_list = patent_data.get('inventors', [])
-                # Filter out "et al." and similar placeholder text
-                filtered_inventors = []
-                for inventor in inventors_list:
-                    inventor_clean = inventor.strip()
-                    if inventor_clean.lower() not in ['et al.', 'et al', 'and others', 'others']:
-                        filtered_inventors.append(inventor_clean)
-                
-                inventors_str = ", ".join(filtered_inventors)
-                table_row = PatentTableRow(
+                # Create table row data, filtering out "et al." and similar placeholder text.
+                # The values come from our own extraction, so validation is skipped.
+                table_row = PatentTableRow.model_construct(
                     patent_number=patent_number,
-                    inventors=inventors_str,
-                    publication_date=patent_data.get('publication_date', 'Unknown'),
-                    description=patent_data.get('title', 'Unknown Title'),
+                    inventors=", ".join(clean_inventors(patent.inventors)),
+                    publication_date=patent.publication_date,
+                    description=patent.title,
                     status="completed"
                 )
-                
-                # Send completion update
-                yield f"data: {json.dumps({'type': 'complete', 'patent': patent_number, 'data': table_row.dict(), 'processing_time': round(processing_time, 2), 'index': i})}\n\n"
-                
-                # Small delay to prevent overwhelming the client
-                await asyncio.sleep(0.1)
+                return i, patent_number, table_row, round(processing_time, 2)
                 
             except Exception as e:
-                error_row = PatentTableRow(
-                    patent_number=patent_number,
-                    inventors="Error",
-                    publication_date="Error",
-                    description=f"Error: {str(e)}",
-                    status="error"
-                )
-                yield f"data: {json.dumps({'type': 'error', 'patent': patent_number, 'data': error_row.dict(), 'error': str(e), 'index': i})}\n\n"
+                return i, patent_number, e, None
+
+    async def generate_updates():
+        """Generate SSE updates for patent processing"""
+        # Send status updates up front; the frontend matches rows by index
+        for i, patent_number in enumerate(request.patent_numbers):
+            yield sse_event({'type': 'status', 'patent': patent_number, 'message': 'Processing...', 'index': i})
+        
+        tasks = [
+            asyncio.create_task(process_patent(i, patent_number))
+            for i, patent_number in enumerate(request.patent_numbers)
+        ]
+        
+        try:
+            # Stream each result as soon as its extraction finishes
+            for next_done in asyncio.as_completed(tasks):
+                i, patent_number, result, processing_time = await next_done
+                
+                if isinstance(result, Exception):
+                    error_row = PatentTableRow(
+                        patent_number=patent_number,
+                        inventors="Error",
+                        publication_date="Error",
+                        description=f"Error: {str(result)}",
+                        status="error"
+                    )
+                    yield sse_event({'type': 'error', 'patent': patent_number, 'data': error_row.model_dump(), 'error': str(result), 'index': i})
+                else:
+                    yield sse_event({'type': 'complete', 'patent': patent_number, 'data': result.model_dump(), 'processing_time': processing_time, 'index': i})
+        finally:
+            # Client disconnected or stream finished; don't leave orphaned extractions
+            for task in tasks:
+                task.cancel()
         
         # Send completion signal
-        yield f"data: {json.dumps({'type': 'finished', 'total': len(request.patent_numbers)})}\n\n"
+        yield sse_event({'type': 'finished', 'total': len(request.patent_numbers)})
     
     return StreamingResponse(
         generate_updates(),
-        media_type="text/plain",
+        media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
-            "Content-Type": "text/event-stream",
         }
     )
 
+def _semantic_cache_text(inventor_names: List[str], patent_title: str) -> str:
+    """Text that is embedded to find near-duplicate analysis requests"""
+    return f"Inventors: {', '.join(inventor_names)} | Patent: {patent_title}"
+
+def _semantic_entry(analysis: Dict, patent_number: str) -> Dict:
+    """Semantic cache value: the analysis plus the patent it was made for"""
+    return {"patent_number": patent_number.strip().upper(), "analysis": analysis}
+
+def _semantic_hit(entry: Optional[Dict], patent_number: str, inventor_names: List[str]) -> Optional[Dict]:
+    """
+    The cached analysis if a near-duplicate hit is for the same patent and the
+    requested people, else None. Requests that differ only in a short name, or
+    in the patent behind a similar title, embed closely, so similarity alone can
+    return someone else's analysis. Full analyses ({"inventors": [...]}) are
+    trimmed to the requested inventors.
+    """
+    if not entry or entry["patent_number"] != patent_number.strip().upper():
+        return None
+    analysis = entry["analysis"]
+    entries = analysis["inventors"] if "inventors" in analysis else [analysis]
+    cached_names = [cached.get("name", "") for cached in entries]
+    indices = [best_name_match(name, cached_names) for name in inventor_names]
+    if not indices or None in indices:
+        return None
+    if "inventors" not in analysis:
+        return analysis
+    return {**analysis, "inventors": [entries[index] for index in dict.fromkeys(indices)]}
+
+def _match_inventor_analysis(contact_analysis: Dict, inventor_name: str) -> Optional[Dict]:
+    """Pick the AI analysis entry that belongs to the given inventor"""
+    inventors = contact_analysis.get("inventors", [])
+    # Fuzzy match to tolerate minor name variations from the AI
+    index = best_name_match(inventor_name, [inventor.get("name", "") for inventor in inventors])
+    return inventors[index] if index is not None else None
+
+async def _lookup_linkedin_url(inventor_name: str, company: str, patent_title: str) -> Optional[str]:
+    """Run the LinkedIn search for one inventor and return the profile URL, if any"""
+    logger.info("Performing LinkedIn search for %s", inventor_name)
+    if not linkedin_search_service:
+        logger.warning("LinkedIn Search Service not available")
+        return None
+
+    cache_key = (inventor_name.lower(), (patent_title or '').lower())
+    cached = linkedin_url_cache.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        logger.info("LinkedIn lookup cached for %s: %s", inventor_name, cached[1] or 'not found')
+        return cached[1]
+    if cached:
+        del linkedin_url_cache[cache_key]
+
+    inventor_for_linkedin = {
+        'name': inventor_name,
+        'company': company or '',
+        'patent_title': patent_title,
+    }
+    linkedin_results = await linkedin_search_service.find_linkedin_profiles([inventor_for_linkedin])
+    
+    found_url = None
+    if linkedin_results and linkedin_results[0].get('linkedin_found'):
+        found_url = linkedin_results[0].get('linkedin_url')
+        logger.info("Found LinkedIn URL for %s: %s", inventor_name, found_url)
+    else:
+        logger.info("LinkedIn profile not found for %s", inventor_name)
+
+    # Don't remember failures caused by errors, only genuine "not found" results
+    if found_url or (linkedin_results and 'error' not in linkedin_results[0]):
+        ttl = LINKEDIN_FOUND_TTL if found_url else LINKEDIN_NOT_FOUND_TTL
+        _remember_linkedin_url(cache_key, ttl, found_url)
+    return found_url
+
+def _remember_linkedin_url(cache_key: tuple, ttl: float, found_url: Optional[str]):
+    """Cache a lookup, pruning expired entries and then the oldest ones once the cache is full"""
+    now = time.monotonic()
+    if len(linkedin_url_cache) >= LINKEDIN_URL_CACHE_SIZE:
+        for key in [key for key, (expires_at, _) in linkedin_url_cache.items() if expires_at <= now]:
+            del linkedin_url_cache[key]
+        # Dicts keep insertion order, so the first keys are the oldest
+        while len(linkedin_url_cache) >= LINKEDIN_URL_CACHE_SIZE:
+            del linkedin_url_cache[next(iter(linkedin_url_cache))]
+    linkedin_url_cache[cache_key] = (now + ttl, found_url)
+
 @app.post("/analyze-inventor")
 async def analyze_single_inventor(request: InventorAnalysisRequest):
     """Analyze a single inventor for contact information"""
@@ -252,7 +420,7 @@ async def analyze_single_inventor(request: InventorAnalysisRequest):
     try:
         # Filter out non-person names like "et al."
         inventor_name = request.inventor_name.strip()
-        if inventor_name.lower() in ['et al.', 'et al', 'and others', 'others']:
+        if is_placeholder_name(inventor_name):
             raise HTTPException(status_code=400, detail="Cannot analyze 'et al.' or similar placeholder names")
         
         # Check if it's not empty
@@ -260,10 +428,18 @@ async def analyze_single_inventor(request: InventorAnalysisRequest):
             raise HTTPException(status_code=400, detail="Inventor name cannot be empty")
         
         # Check cache first
-        cached_analysis = cache_service.get_ai_analysis(inventor_name, request.patent_number)
+        cached_analysis = await aget_ai_analysis(inventor_name, request.patent_number)
         if cached_analysis:
             return {"cached": True, "data": cached_analysis}
         
+        # Then look for a near-duplicate request (name spelling / title variants)
+        semantic_key = None
+        if semantic_cache:
+            semantic_key = await semantic_cache.embed(_semantic_cache_text([inventor_name], request.patent_title))
+            similar_analysis = _semantic_hit(semantic_cache.lookup(semantic_key), request.patent_number, [inventor_name])
+            if similar_analysis:
+                return {"cached": True, "data": similar_analysis}
+        
         # Perform analysis
         analysis_data = {
             'patent_number': request.patent_number,
@@ -272,52 +448,32 @@ async def analyze_single_inventor(request: InventorAnalysisRequest):
             'assignee': None
         }
         
-        contact_analysis = await openai_service.analyze_inventor_contacts(analysis_data)
+        # The LinkedIn search only needs the name and patent title, so run it
+        # alongside the LLM call instead of waiting for the AI-derived company
+        contact_analysis, linkedin_url = await asyncio.gather(
+            openai_service.analyze_inventor_contacts(analysis_data),
+            _lookup_linkedin_url(inventor_name, '', request.patent_title)
+        )
         
         if "error" in contact_analysis:
             raise HTTPException(status_code=500, detail=contact_analysis["error"])
         
         # Extract the analysis for this specific inventor
-        inventor_analysis = None
-        for inventor in contact_analysis.get("inventors", []):
-            # Make comparison more robust to handle minor name variations from the AI
-            ai_name = inventor.get("name", "").lower()
-            requested_name = inventor_name.lower()
-            if requested_name in ai_name or ai_name in requested_name:
-                inventor_analysis = inventor
-                break
+        inventor_analysis = _match_inventor_analysis(contact_analysis, inventor_name)
         
         if not inventor_analysis:
             raise HTTPException(status_code=404, detail="Inventor analysis not found")
 
-        # --- New: Perform LinkedIn Search ---
-        print(f"🔬 Performing LinkedIn search for {inventor_name}...")
-        if linkedin_search_service:
-            inventor_for_linkedin = {
-                'name': inventor_name,
-                'company': inventor_analysis.get('company', ''), # Use company from AI analysis if available
-                'patent_title': request.patent_title,
-            }
-            linkedin_results = await linkedin_search_service.find_linkedin_profiles([inventor_for_linkedin])
-            
-            if linkedin_results and linkedin_results[0].get('linkedin_found'):
-                found_url = linkedin_results[0].get('linkedin_url')
-                print(f"✅ Found LinkedIn URL: {found_url}")
-                inventor_analysis['linkedin_url'] = found_url
-            else:
-                print("❌ LinkedIn profile not found.")
-                inventor_analysis['linkedin_url'] = None
-        else:
-            print("⚠️ LinkedIn Search Service not available.")
-            inventor_analysis['linkedin_url'] = None
-        # --- End of LinkedIn Search ---
+        inventor_analysis['linkedin_url'] = linkedin_url
 
         # Ensure the name is always in the analysis for the frontend.
         if 'name' not in inventor_analysis or not inventor_analysis['name']:
             inventor_analysis['name'] = inventor_name
 
         # Cache the combined result
-        cache_service.set_ai_analysis(inventor_name, request.patent_number, inventor_analysis)
+        await aset_ai_analysis(inventor_name, request.patent_number, inventor_analysis)
+        if semantic_cache:
+            semantic_cache.store(semantic_key, _semantic_entry(inventor_analysis, request.patent_number))
         
         return {"cached": False, "data": inventor_analysis}
         
@@ -325,7 +481,93 @@ async def analyze_single_inventor(request: InventorAnalysisRequest):
         # Re-raise HTTP exceptions as-is
         raise
     except Exception as e:
-        print(f"Error analyzing inventor {request.inventor_name}: {e}")
+        logger.error("Error analyzing inventor %s: %s", request.inventor_name, e)
+        raise HTTPException(status_code=500, detail=f"An error occurred during analysis: {str(e)}")
+
+@app.post("/analyze-inventors-batch")
+async def analyze_inventors_batch(request: InventorBatchAnalysisRequest):
+    """Analyze all inventors of a patent with a single OpenAI call and concurrent LinkedIn lookups"""
+    if not openai_service:
+        raise HTTPException(status_code=503, detail="OpenAI Service is not available. Please check API key.")
+    
+    try:
+        # Filter out non-person names like "et al." and duplicates
+        inventor_names = list(dict.fromkeys(clean_inventors(request.inventor_names)))
+        
+        if not inventor_names:
+            raise HTTPException(status_code=400, detail="No valid inventor names to analyze")
+        
+        results = {}
+        uncached_names = []
+        cached = await asyncio.gather(*[aget_ai_analysis(name, request.patent_number) for name in inventor_names])
+        for inventor_name, cached_analysis in zip(inventor_names, cached):
+            if cached_analysis:
+                results[inventor_name] = {"inventor_name": inventor_name, "cached": True, "data": cached_analysis}
+            else:
+                uncached_names.append(inventor_name)
+        
+        # Then look for near-duplicate requests, embedding all names in one call
+        semantic_keys = {}
+        if semantic_cache and uncached_names:
+            vectors = await semantic_cache.embed_many(
+                [_semantic_cache_text([name], request.patent_title) for name in uncached_names]
+            )
+            still_uncached = []
+            for inventor_name, vector in zip(uncached_names, vectors):
+                similar_analysis = _semantic_hit(semantic_cache.lookup(vector), request.patent_number, [inventor_name])
+                if similar_analysis:
+                    results[inventor_name] = {"inventor_name": inventor_name, "cached": True, "data": similar_analysis}
+                else:
+                    semantic_keys[inventor_name] = vector
+                    still_uncached.append(inventor_name)
+            uncached_names = still_uncached
+        
+        if uncached_names:
+            linkedin_semaphore = asyncio.Semaphore(4)
+
+            async def lookup_linkedin(inventor_name: str) -> Optional[str]:
+                async with linkedin_semaphore:
+                    return await _lookup_linkedin_url(inventor_name, '', request.patent_title)
+            
+            # One LLM call covers every uncached inventor of this patent, while
+            # the LinkedIn lookups run alongside it
+            contact_analysis, linkedin_urls = await asyncio.gather(
+                openai_service.analyze_inventor_contacts({
+                    'patent_number': request.patent_number,
+                    'title': request.patent_title,
+                    'inventors': uncached_names,
+                    'assignee': None
+                }),
+                asyncio.gather(*[lookup_linkedin(name) for name in uncached_names])
+            )
+            
+            if "error" in contact_analysis:
+                raise HTTPException(status_code=500, detail=contact_analysis["error"])
+            
+            async def enrich(inventor_name: str, linkedin_url: Optional[str]) -> Dict:
+                inventor_analysis = _match_inventor_analysis(contact_analysis, inventor_name)
+                if not inventor_analysis:
+                    return {"inventor_name": inventor_name, "cached": False, "data": None, "error": "Inventor analysis not found"}
+                
+                inventor_analysis['linkedin_url'] = linkedin_url
+                
+                if 'name' not in inventor_analysis or not inventor_analysis['name']:
+                    inventor_analysis['name'] = inventor_name
+                
+                await aset_ai_analysis(inventor_name, request.patent_number, inventor_analysis)
+                if semantic_cache:
+                    semantic_cache.store(semantic_keys.get(inventor_name), _semantic_entry(inventor_analysis, request.patent_number))
+                return {"inventor_name": inventor_name, "cached": False, "data": inventor_analysis}
+            
+            for result in await asyncio.gather(*[enrich(name, url) for name, url in zip(uncached_names, linkedin_urls)]):
+                results[result["inventor_name"]] = result
+        
+        return {"results": [results[name] for name in inventor_names]}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error analyzing inventors for %s: %s", request.patent_number, e)
         raise HTTPException(status_code=500, detail=f"An error occurred during analysis: {str(e)}")
 
 @app.post("/analyze-contacts", response_model=ContactAnalysisResponse)
@@ -335,10 +577,21 @@ async def analyze_contacts(request: ContactAnalysisRequest):
         raise HTTPException(status_code=503, detail="OpenAI Service is not available. Please check API key.")
 
     try:
-        analysis_result = await openai_service.analyze_inventor_contacts(request.dict())
-        
-        if "error" in analysis_result:
-            raise HTTPException(status_code=500, detail=analysis_result["error"])
+        semantic_key = None
+        analysis_result = None
+        if semantic_cache:
+            inventor_names = clean_inventors(request.inventors)
+            semantic_key = await semantic_cache.embed(_semantic_cache_text(inventor_names, request.title))
+            analysis_result = _semantic_hit(semantic_cache.lookup(semantic_key), request.patent_number, inventor_names)
+
+        if not analysis_result:
+            analysis_result = await openai_service.analyze_inventor_contacts(request.dict())
+            
+            if "error" in analysis_result:
+                raise HTTPException(status_code=500, detail=analysis_result["error"])
+
+            if semantic_cache:
+                semantic_cache.store(semantic_key, _semantic_entry(analysis_result, request.patent_number))
 
         enriched_inventors = []
         for inventor_analysis in analysis_result.get("inventors", []):
@@ -353,9 +606,24 @@ async def analyze_contacts(request: ContactAnalysisRequest):
         return ContactAnalysisResponse(enriched_inventors=enriched_inventors)
 
     except Exception as e:
-        print(f"Error in /analyze-contacts: {e}")
+        logger.error("Error in /analyze-contacts: %s", e)
         raise HTTPException(status_code=500, detail="An unexpected error occurred during contact analysis.")
 
+PATENT_EXPORT_COLUMNS = ('Patent Number', 'Inventors', 'Publication Date', 'Title', 'Status')
+
+AI_ANALYSIS_EXPORT_COLUMNS = (
+    'Patent Number', 'Patent Title', 'Inventor Name', 'AI Confidence Score', 'Email Suggestions',
+    'LinkedIn Profile', 'GitHub Search Terms', 'Search Strategy', 'Analysis Date'
+)
+
+def _write_sheet(workbook, sheet_name: str, columns: tuple, rows: List[tuple]):
+    """Write a header row followed by data rows, in order, to a new worksheet"""
+    worksheet = workbook.add_worksheet(sheet_name)
+    header_format = workbook.add_format({'bold': True})
+    worksheet.write_row(0, 0, columns, header_format)
+    for row_index, row in enumerate(rows, start=1):
+        worksheet.write_row(row_index, 0, row)
+
 @app.post("/export-excel")
 async def export_to_excel(request: Request):
     """Export patent data to Excel file with AI analysis"""
@@ -367,67 +635,71 @@ async def export_to_excel(request: Request):
             raise HTTPException(status_code=400, detail="No data to export")
         
         # Clean up the main patent data for export
-        patents_for_export = []
-        for row in table_data:
-            patents_for_export.append({
-                'Patent Number': row.get('patent_number'),
-                'Inventors': row.get('inventors'),
-                'Publication Date': row.get('publication_date'),
-                'Title': row.get('description'),
-                'Status': row.get('status')
-            })
-        df_patents = pd.DataFrame(patents_for_export)
-        
-        # Collect AI analysis data
-        ai_analysis_data = []
-        for row_data in table_data:
+        patents_for_export = [
+            (row.get('patent_number'), row.get('inventors'), row.get('publication_date'),
+             row.get('description'), row.get('status'))
+            for row in table_data
+        ]
+        
+        # Collect AI analysis data concurrently across rows
+        export_semaphore = asyncio.Semaphore(8)
+
+        async def collect_ai_analysis(row_data: Dict) -> List[tuple]:
             patent_number = row_data.get('patent_number')
-            if patent_number:
-                # Get patent data to find inventors
+            if not patent_number:
+                return []
+            
+            rows = []
+            async with export_semaphore:
+                # Get patent data to find inventors; /research-multiple already cached it
                 try:
-                    patent_data = await patent_service_context.extract_patent_data(patent_number)
-                    inventors_list = patent_data.get('inventors', [])
-                    
+                    patent_data = (
+                        await asyncio.to_thread(patent_service_context.get_cached_patent_data, patent_number)
+                        or await patent_service_context.extract_patent_data(patent_number)
+                    )
                     # Filter out "et al." and similar
-                    filtered_inventors = []
-                    for inventor in inventors_list:
-                        inventor_clean = inventor.strip()
-                        if inventor_clean.lower() not in ['et al.', 'et al', 'and others', 'others']:
-                            filtered_inventors.append(inventor_clean)
+                    filtered_inventors = clean_inventors(patent_data.get('inventors', []))
                     
-                    # Check cache for each inventor
-                    for inventor in filtered_inventors:
-                        cached_analysis = cache_service.get_ai_analysis(inventor, patent_number)
+                    # Check cache for all inventors at once
+                    cached_analyses = await asyncio.gather(
+                        *[aget_ai_analysis(inventor, patent_number) for inventor in filtered_inventors]
+                    )
+                    for inventor, cached_analysis in zip(filtered_inventors, cached_analyses):
                         if cached_analysis:
-                            ai_analysis_data.append({
-                                'Patent Number': patent_number,
-                                'Patent Title': row_data.get('description', ''),
-                                'Inventor Name': inventor,
-                                'AI Confidence Score': f"{cached_analysis.get('confidence_score', 0) * 100:.0f}%",
-                                'Email Suggestions': ', '.join(cached_analysis.get('email_suggestions', [])),
-                                'LinkedIn Profile': cached_analysis.get('linkedin_url', 'Not Found'),
-                                'GitHub Search Terms': ', '.join(cached_analysis.get('github_search_terms', [])),
-                                'Search Strategy': cached_analysis.get('search_strategy', ''),
-                                'Analysis Date': 'Cached'
-                            })
+                            rows.append((
+                                patent_number,
+                                row_data.get('description', ''),
+                                inventor,
+                                f"{cached_analysis.get('confidence_score', 0) * 100:.0f}%",
+                                ', '.join(cached_analysis.get('email_suggestions', [])),
+                                cached_analysis.get('linkedin_url', 'Not Found'),
+                                ', '.join(cached_analysis.get('github_search_terms', [])),
+                                cached_analysis.get('search_strategy', ''),
+                                'Cached'
+                            ))
                 except Exception as e:
-                    print(f"Error getting AI analysis for {patent_number}: {e}")
+                    logger.error("Error getting AI analysis for %s: %s", patent_number, e)
+            return rows
+
+        # gather preserves row order, so the sheet matches the table
+        ai_analysis_data = []
+        for rows in await asyncio.gather(*[collect_ai_analysis(row) for row in table_data]):
+            ai_analysis_data.extend(rows)
         
-        # Create Excel file in memory
+        # Create Excel file in memory, writing rows straight through in constant-memory mode
         output = BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            # Write patent data sheet
-            df_patents.to_excel(writer, sheet_name='Patent Data', index=False)
-            
-            # Write AI analysis sheet if there's data
-            if ai_analysis_data:
-                df_ai = pd.DataFrame(ai_analysis_data)
-                df_ai.to_excel(writer, sheet_name='AI Analysis', index=False)
+        workbook = xlsxwriter.Workbook(output, {'constant_memory': True, 'strings_to_urls': False})
+        _write_sheet(workbook, 'Patent Data', PATENT_EXPORT_COLUMNS, patents_for_export)
+        
+        # Write AI analysis sheet if there's data
+        if ai_analysis_data:
+            _write_sheet(workbook, 'AI Analysis', AI_ANALYSIS_EXPORT_COLUMNS, ai_analysis_data)
+        workbook.close()
         
         output.seek(0)
         
         return StreamingResponse(
-            BytesIO(output.getvalue()),
+            output,
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={"Content-Disposition": "attachment; filename=patent_data_with_ai_analysis.xlsx"}
         )
@@ -452,15 +724,37 @@ async def get_cache_stats():
     if not cache_service:
         raise HTTPException(status_code=503, detail="Cache service not available")
     
-    return cache_service.get_cache_stats()
+    stats = cache_service.get_cache_stats()
+    if semantic_cache:
+        stats = {**stats, "semantic_cache": semantic_cache.get_stats()}
+    return stats
 
 @app.post("/clear-cache")
-async def clear_cache(cache_type: str = "all"):
-    """Clear cache"""
+async def clear_cache(cache_type: str = "all", semantic_query: Optional[str] = None):
+    """Clear cache. With semantic_query, only drop semantic entries similar to that text."""
     if not cache_service:
         raise HTTPException(status_code=503, detail="Cache service not available")
     
-    cache_service.clear_cache(cache_type)
+    if semantic_query:
+        if not semantic_cache:
+            raise HTTPException(status_code=503, detail="Semantic cache not available")
+        removed = semantic_cache.invalidate(await semantic_cache.embed(semantic_query))
+        return {"message": f"Semantic cache entries removed: {removed}"}
+
+    if cache_type not in ("semantic", "linkedin"):
+        cache_service.clear_cache(cache_type)
+        if patent_service_context:
+            patent_service_context.clear_memo()
+    if semantic_cache and cache_type in ("all", "semantic"):
+        semantic_cache.clear()
+    if cache_type in ("all", "linkedin"):
+        linkedin_url_cache.clear()
+        if linkedin_search_service:
+            if linkedin_search_service.cache:
+                await asyncio.to_thread(linkedin_search_service.cache.clear)
+            if linkedin_search_service.link_cache:
+                linkedin_search_service.link_cache.clear()
+        await asyncio.to_thread(clear_profile_cache)
     return {"message": f"Cache cleared: {cache_type}"}
 
 @app.get("/test/{patent_number}")
@@ -488,20 +782,13 @@ async def check_ai_cache(patent_number: str):
     try:
         # Get patent data to find inventors
         patent_data = await patent_service_context.extract_patent_data(patent_number)
-        inventors_list = patent_data.get('inventors', [])
         
         # Filter out "et al." and similar
-        filtered_inventors = []
-        for inventor in inventors_list:
-            inventor_clean = inventor.strip()
-            if inventor_clean.lower() not in ['et al.', 'et al', 'and others', 'others']:
-                filtered_inventors.append(inventor_clean)
-        
-        # Check cache for each inventor
-        cached_inventors = []
-        for inventor in filtered_inventors:
-            if cache_service.get_ai_analysis(inventor, patent_number):
-                cached_inventors.append(inventor)
+        filtered_inventors = clean_inventors(patent_data.get('inventors', []))
+        
+        # Check cache for each inventor concurrently
+        cached = await asyncio.gather(*[aget_ai_analysis(inventor, patent_number) for inventor in filtered_inventors])
+        cached_inventors = [inventor for inventor, analysis in zip(filtered_inventors, cached) if analysis]
         
         return {
             "patent_number": patent_number,
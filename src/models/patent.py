@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 from datetime import datetime
 
 class Patent(BaseModel):
@@ -25,4 +26,28 @@ class Inventor(BaseModel):
     search_results: List[str] = Field(default_factory=list)
     
     def __str__(self):
-        return f"{self.name} (confidence: {self.confidence_score:.2f})" 
\ No newline at end of file
+        return f"{self.name} (confidence: {self.confidence_score:.2f})" 
+
+@dataclass(slots=True)
+class PatentView:
+    """
+    Typed view over the dict returned by PatentService.extract_patent_data, built once per request.
+    Missing or null fields get their defaults here, since rows built from it skip validation.
+    """
+    patent_number: Optional[str]
+    title: str
+    inventors: List[str]
+    publication_date: str
+    assignee: Optional[str]
+    source: str
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PatentView":
+        return cls(
+            patent_number=data.get('patent_number'),
+            title=data.get('title') or 'Unknown Title',
+            inventors=data.get('inventors') or [],
+            publication_date=data.get('publication_date') or 'Unknown',
+            assignee=data.get('assignee'),
+            source=data.get('source') or 'unknown',
+        )
@@ -0,0 +1,219 @@
+# src/services/browser_pool.py - Pooled Playwright browser contexts on one shared Chromium
+
+import asyncio
+import os
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext, Route
+
+# Lightweight Chromium flags shared by every browser this app launches
+CHROMIUM_ARGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--metrics-recording-only',
+    '--mute-audio',
+    '--no-first-run',
+    '--disable-blink-features=AutomationControlled',
+]
+
+# Resource types that never contribute to text extraction
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+# Analytics/ad hosts (LinkedIn's tracking endpoint and the federal DAP script USPTO pages load)
+# whose beacons only delay page load events
+BLOCKED_HOSTS_RE = re.compile(
+    r'^https?://([^/]*\.)?(bat\.bing\.com|c\.bing\.com|doubleclick\.net|googlesyndication\.com'
+    r'|google-analytics\.com|googletagmanager\.com|hotjar\.com|px\.ads\.linkedin\.com|snap\.licdn\.com'
+    r'|dap\.digitalgov\.gov)(:\d+)?/'
+    r'|^https?://(www\.)?linkedin\.com/li/track'
+)
+
+def resource_optimization_enabled() -> bool:
+    """Resource blocking is on unless RESOURCE_OPTIMIZATION=0 (useful when debugging screenshots)"""
+    return os.getenv("RESOURCE_OPTIMIZATION", "1") != "0"
+
+async def _block_heavy_resources(route: Route):
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_HOSTS_RE.match(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def optimize_context(context: BrowserContext) -> BrowserContext:
+    """Abort image/media/font/stylesheet and analytics requests on the context, if enabled"""
+    if resource_optimization_enabled():
+        await context.route("**/*", _block_heavy_resources)
+    return context
+
+class _Pooled:
+    """A pooled Playwright object plus the bookkeeping needed to recycle it"""
+
+    def __init__(self, resource):
+        self.resource = resource
+        self.uses = 0
+        self.created_at = time.monotonic()
+        self.pages: Optional["PagePool"] = None
+
+    def is_expired(self, max_uses: int, max_age: float) -> bool:
+        return self.uses >= max_uses or time.monotonic() - self.created_at >= max_age
+
+class PagePool:
+    """
+    Reuses warm pages on a single browser context instead of paying for
+    new_page()/close() on every navigation. Pages are disposed after `max_uses`
+    checkouts or `max_age` seconds, which bounds the response history a
+    long-lived page accumulates.
+    """
+
+    def __init__(self, context: BrowserContext, max_pages: int = 4, max_uses: int = 30, max_age: float = 300):
+        self.context = context
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self._slots = asyncio.Semaphore(max_pages)
+        self._idle: List[_Pooled] = []
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Check out a page for exclusive use"""
+        await self._slots.acquire()
+        pooled = None
+        try:
+            while self._idle and pooled is None:
+                candidate = self._idle.pop()
+                if not candidate.resource.is_closed():
+                    pooled = candidate
+            if pooled is None:
+                pooled = _Pooled(await self.context.new_page())
+            yield pooled.resource
+        finally:
+            if pooled is not None:
+                pooled.uses += 1
+                page = pooled.resource
+                if not pooled.is_expired(self.max_uses, self.max_age):
+                    if not page.is_closed():
+                        self._idle.append(pooled)
+                elif not page.is_closed():
+                    try:
+                        await page.close()
+                    except Exception as e:
+                        print(f"Error closing recycled page: {e}")
+            self._slots.release()
+
+    async def close(self):
+        """Close all idle pages"""
+        while self._idle:
+            page = self._idle.pop().resource
+            if not page.is_closed():
+                await page.close()
+
+class BrowserPool:
+    """
+    Hands out browser contexts from a single Chromium instance so that several
+    pages can be scraped in parallel instead of lock-stepping on one context.
+
+    Contexts are created lazily up to `size` and recycled after `max_uses`
+    checkouts or `max_age` seconds to keep Playwright's per-context state bounded.
+    """
+
+    def __init__(self, size: Optional[int] = None, max_uses: int = 50, max_age: float = 600,
+                 launch_args: Optional[List[str]] = None, context_options: Optional[Dict] = None):
+        self.size = size or int(os.getenv("BROWSER_POOL_SIZE", "4"))
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.launch_args = launch_args or CHROMIUM_ARGS
+        self.context_options = context_options or {}
+        self.playwright = None
+        self.browser: Optional[Browser] = None
+        self._launching: Optional[asyncio.Future] = None
+        self._slots = asyncio.Semaphore(self.size)
+        self._idle: List[_Pooled] = []
+        self._parent: Optional["BrowserPool"] = None
+
+    def derive(self, size: Optional[int] = None, context_options: Optional[Dict] = None) -> "BrowserPool":
+        """
+        Create a pool with its own contexts and options on this pool's browser,
+        so another service can scrape without launching a second Chromium.
+        """
+        pool = BrowserPool(size=size or self.size, max_uses=self.max_uses, max_age=self.max_age,
+                           launch_args=self.launch_args, context_options=context_options)
+        pool._parent = self
+        return pool
+
+    async def start(self) -> Browser:
+        """Launch the browser if needed; concurrent callers share one launch"""
+        if self._parent:
+            return await self._parent.start()
+        if self.browser is None:
+            if self._launching is None:
+                self._launching = asyncio.ensure_future(self._launch())
+            try:
+                await asyncio.shield(self._launching)
+            except Exception:
+                self._launching = None
+                raise
+        return self.browser
+
+    async def _launch(self):
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(headless=True, args=self.launch_args, chromium_sandbox=False)
+
+    async def _new_context(self) -> _Pooled:
+        browser = await self.start()
+        context = await browser.new_context(**self.context_options)
+        return _Pooled(await optimize_context(context))
+
+    @asynccontextmanager
+    async def _checkout(self):
+        await self._slots.acquire()
+        pooled = None
+        try:
+            pooled = self._idle.pop() if self._idle else await self._new_context()
+            yield pooled
+        finally:
+            if pooled is not None:
+                pooled.uses += 1
+                if pooled.is_expired(self.max_uses, self.max_age):
+                    try:
+                        await pooled.resource.close()
+                    except Exception as e:
+                        print(f"Error closing recycled browser context: {e}")
+                else:
+                    self._idle.append(pooled)
+            self._slots.release()
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Check out a browser context for exclusive use"""
+        async with self._checkout() as pooled:
+            yield pooled.resource
+
+    @asynccontextmanager
+    async def acquire_page(self):
+        """Check out a context together with a warm, reusable page on it"""
+        async with self._checkout() as pooled:
+            # The context is held exclusively, so one page per context is enough
+            if pooled.pages is None:
+                pooled.pages = PagePool(pooled.resource, max_pages=1)
+            async with pooled.pages.acquire() as page:
+                yield page
+
+    async def close(self):
+        """Close all idle contexts and shut the browser down (unless it belongs to a parent pool)"""
+        while self._idle:
+            await self._idle.pop().resource.close()
+        if self._parent:
+            return
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+        self._launching = None
@@ -0,0 +1,61 @@
+# src/services/disk_cache.py - Small persistent key/value cache with per-entry TTL
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+import orjson
+
+def cache_key(*parts: str) -> str:
+    """Stable SHA-1 key for a tuple of strings"""
+    return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+class DiskCache:
+    """
+    SQLite-backed cache that survives restarts. Values are stored as orjson
+    blobs and expire after the TTL given when they were set. The async helpers
+    run the blocking SQLite calls in a worker thread.
+    """
+
+    def __init__(self, path: str, table: str = 'cache'):
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the stored value, or None if missing or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value FROM {self.table} WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value for `ttl` seconds"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, orjson.dumps(value), time.time() + ttl)
+            )
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table}")
+
+    async def aget(self, key: str) -> Optional[Any]:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Any, ttl: float) -> None:
+        await asyncio.to_thread(self.set, key, value, ttl)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,211 +1,453 @@
 # src/services/linkedin_playwright_search.py - LinkedIn Profile Discovery using Playwright
 
 import asyncio
+import functools
+import logging
+import os
 import re
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import time
 import random
-from playwright.async_api import async_playwright, Browser, Page
-from services.openai_service import OpenAIService # Import the service
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+from playwright.async_api import Page
+from rapidfuzz import fuzz, utils as fuzz_utils
+from services.openai_service import OpenAIService, get_default_openai_service
+from services.browser_pool import BrowserPool
+from services.disk_cache import DiskCache, cache_key
+from services.semantic_cache import SemanticCache
 import json
 
+logger = logging.getLogger(__name__)
+
+# Dump every search's extracted links to search_results_log.json (debugging only)
+DEBUG_LOG_LINKS = os.getenv("LINKEDIN_DEBUG_LOG_LINKS") == "1"
+
+# Upper bound on links sent to the AI per search results page
+MAX_RESULT_LINKS = 50
+
+# Minimum title/name token-set score for taking a lone LinkedIn result without asking the AI
+DIRECT_MATCH_MIN_SCORE = 80
+
+# Inventors whose result links are analyzed together in one AI call
+LINK_ANALYSIS_BATCH_SIZE = 8
+
+# Search results and link analyses are kept on disk across restarts
+SEARCH_CACHE_TTL = 30 * 24 * 3600
+
+LINKEDIN_CONTEXT_OPTIONS = {
+    'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'viewport': {'width': 1920, 'height': 1080},
+    'locale': 'en-US',
+}
+
+# Words that never help narrow a search down to an inventor
+_COMMON_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'system', 'method', 'apparatus', 'device'})
+
+@functools.lru_cache(maxsize=4096)
+def _extract_key_terms(patent_title: str) -> str:
+    # Remove common words and keep technical terms
+    words = patent_title.lower().split()
+    key_words = [word for word in words if word not in _COMMON_WORDS and len(word) > 3]
+    return ' '.join(key_words[:3])  # Return top 3 key terms
+
+@functools.lru_cache(maxsize=4096)
+def _extract_name_from_title(title: str) -> str:
+    # LinkedIn titles usually have format: "Name - Title at Company | LinkedIn"
+    if ' - ' in title:
+        return title.split(' - ')[0].strip()
+    elif ' | LinkedIn' in title:
+        return title.split(' | LinkedIn')[0].strip()
+    else:
+        return title.strip()
+
+# Using only Bing and the specific query format as requested
+_SEARCH_ENGINES = (
+    {'engine': 'bing', 'url': 'https://www.bing.com/search'},
+)
+
+# Consent button texts, matched case-insensitively as substrings like Playwright's :has-text()
+_CONSENT_TEXTS = (
+    'accept all',
+    'i agree',
+    'reject all',
+    'alle akzeptieren', # German for "Accept all"
+)
+_CONSENT_SELECTORS = (
+    '[aria-label="Accept all"]',
+    '[aria-label="Reject all"]',
+    '#L2AGLb', # Google's "I agree" button ID in some regions
+)
+# Built once; passed as the page.evaluate argument
+_CONSENT_ARGS = [list(_CONSENT_TEXTS), list(_CONSENT_SELECTORS)]
+
+# Clicks the first visible consent button, returning what matched (or null)
+_CONSENT_SCRIPT = """([texts, selectors]) => {
+    const visible = (el) => el && el.offsetParent !== null;
+    for (const button of document.querySelectorAll('button')) {
+        const text = button.innerText.trim().toLowerCase();
+        if (texts.some((t) => text.includes(t)) && visible(button)) {
+            button.click();
+            return text;
+        }
+    }
+    for (const selector of selectors) {
+        const el = document.querySelector(selector);
+        if (visible(el)) {
+            el.click();
+            return selector;
+        }
+    }
+    return null;
+}"""
+
+# Names that can never identify a person; searching for them only burns a page load and an LLM call
+_JUNK_NAMES = frozenset({'unknown', 'n/a', 'anonymous', 'inventor'})
+# At least one token that is more than an initial ("Li Na" passes, "J. S." does not)
+_NAME_TOKEN_RE = re.compile(r'[^\W\d_]{2,}')
+
+def _is_searchable_name(query: str) -> bool:
+    name = query.strip()
+    return len(name) >= 3 and name.lower() not in _JUNK_NAMES and bool(_NAME_TOKEN_RE.search(name))
+
+# Links that are search-engine navigation rather than results
+_SKIP_LINK_RE = re.compile(r'^javascript:|^#|bing\.com/search')
+
+def _parse_result_links(html: str, base_url: str, limit: int) -> List[Dict]:
+    """Deduplicated {url, title} pairs from Bing's result container (all anchors if it is missing)"""
+    soup = BeautifulSoup(html, 'lxml')
+    anchors = soup.select('#b_results a, .b_algo a') or soup.find_all('a')
+    seen = set()
+    links = []
+    for anchor in anchors:
+        href = anchor.get('href')
+        if not href or _SKIP_LINK_RE.search(href):
+            continue
+        url = urljoin(base_url, href)
+        if url in seen or _SKIP_LINK_RE.search(url):
+            continue
+        title = anchor.get_text(' ', strip=True)
+        if not title:
+            continue
+        seen.add(url)
+        links.append({'url': url, 'title': title})
+        if len(links) >= limit:
+            break
+    return links
+
+def _write_links_log(results: List[Dict]):
+    try:
+        with open("search_results_log.json", "w") as f: # Overwrite with the latest search
+            f.write(f"--- New Search at {time.strftime('%Y-%m-%d %H:%M:%S')} ---\n")
+            json.dump(results, f, indent=2)
+            f.write("\n\n")
+        logger.debug("Logged all extracted links to search_results_log.json")
+    except Exception as e:
+        logger.debug("Failed to log search results to file: %s", e)
+
 class LinkedInPlaywrightSearchService:
-    def __init__(self, browser_context=None, openai_service: OpenAIService = None):
+    def __init__(self, browser_pool: Optional[BrowserPool] = None, openai_service: OpenAIService = None,
+                 cache: Optional[DiskCache] = None):
         """
         Initialize LinkedIn search service using Playwright
         
         Args:
-            browser_context: Optional existing browser context to reuse
+            browser_pool: Optional existing browser pool whose Chromium instance is reused
             openai_service: An instance of the OpenAIService
+            cache: Optional persistent cache for search results; one is opened if omitted
         """
-        self.browser_context = browser_context
-        self.page = None
+        self.shared_pool = browser_pool
+        self.browser_pool = None
         self.openai_service = openai_service
+        self.cache = cache
+        self._owns_cache = cache is None
+        self.link_cache: Optional[SemanticCache] = None
     
     async def __aenter__(self):
         """Async context manager entry"""
-        if not self.browser_context:
-            self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(headless=True)
-            self.browser_context = await self.browser.new_context(
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
-                viewport={'width': 1920, 'height': 1080},
-                locale='en-US'
-            )
-        
-        self.page = await self.browser_context.new_page()
+        # Searches run in their own pooled contexts; the browser itself is launched
+        # once and shared with the patent service when a pool is passed in
+        if self.shared_pool:
+            self.browser_pool = self.shared_pool.derive(context_options=LINKEDIN_CONTEXT_OPTIONS)
+        else:
+            self.browser_pool = BrowserPool(context_options=LINKEDIN_CONTEXT_OPTIONS)
+        await self.browser_pool.start()
+
+        if self.cache is None:
+            self.cache = DiskCache(os.getenv("LINKEDIN_CACHE_PATH", "linkedin_cache.sqlite"))
 
         # If openai_service is not provided, create a new one.
         if not self.openai_service:
             try:
-                self.openai_service = OpenAIService()
-                print("✓ LinkedInPlaywrightSearchService created its own OpenAI Service instance.")
+                self.openai_service = get_default_openai_service()
+                logger.info("LinkedInPlaywrightSearchService is using the shared OpenAI Service instance")
             except ValueError as e:
-                print(f"⚠️ WARNING: Could not initialize OpenAI Service within Playwright service: {e}")
+                logger.warning("Could not initialize OpenAI Service within Playwright service: %s", e)
                 self.openai_service = None
 
+        # Near-duplicate link sets (name variants, reordered results) reuse an earlier AI answer;
+        # a threshold >= 1 disables this
+        link_threshold = float(os.getenv("LINKEDIN_SEMANTIC_THRESHOLD", "0.95"))
+        if self.openai_service and link_threshold < 1:
+            self.link_cache = SemanticCache(self.openai_service.embed_texts, threshold=link_threshold)
+
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.page:
-            await self.page.close()
-        if not self.browser_context:
-            if self.browser:
-                await self.browser.close()
-            if hasattr(self, 'playwright'):
-                await self.playwright.stop()
+        if self.browser_pool:
+            await self.browser_pool.close()
+            self.browser_pool = None
+        if self.cache and self._owns_cache:
+            self.cache.close()
+            self.cache = None
     
-    async def search_people(self, query: str, limit: int = 10) -> List[Dict]:
+    async def search_people(self, query: str, limit: int = 10, patent_title: Optional[str] = None) -> List[Dict]:
         """
         Search for people using search engines with Playwright
         
         Args:
             query: Search query (name, company, etc.)
             limit: Maximum number of results
+            patent_title: Optional patent title whose key terms refine the query
             
         Returns:
             List of people profiles with LinkedIn URLs
         """
-        if not self.page:
+        self._check_ready()
+
+        if not _is_searchable_name(query):
+            logger.info("Skipping search for non-name query: %r", query)
+            return []
+        
+        try:
+            search_key, attempts = self._search_plan(query, patent_title)
+            cached_profiles = await self.cache.aget(search_key)
+            if cached_profiles is not None:
+                logger.debug("Using cached LinkedIn search result for: %s", query)
+                return cached_profiles
+
+            return await self._search_attempts(query, attempts, search_key) or []
+                
+        except Exception as e:
+            logger.warning("Error in search: %s", e)
+            return []
+
+    def _check_ready(self):
+        if not self.browser_pool:
             raise Exception("Service not initialized. Use async context manager.")
         
         if not self.openai_service:
             raise Exception("OpenAI Service is not available to the Playwright Search Service.")
+
+    def _search_plan(self, query: str, patent_title: Optional[str]) -> Tuple[str, List[Tuple[Dict, str]]]:
+        """Cache key and ordered (engine, query variation) attempts for a search"""
+        key_terms = self._extract_key_terms(patent_title) if patent_title else ''
+        search_key = cache_key('search', ' '.join(query.lower().split()), key_terms)
+
+        query_variations = [
+            f'{query} linkedin',
+            f'{query} {key_terms} linkedin'
+        ] if patent_title else [f'{query} linkedin']
+
+        return search_key, [(engine, q_variation) for engine in _SEARCH_ENGINES for q_variation in query_variations]
+
+    async def _search_attempts(self, query: str, attempts: List[Tuple[Dict, str]], search_key: str) -> Optional[List[Dict]]:
+        """
+        Run the attempts concurrently, each in its own context; the first profile found wins.
+        Returns None when every attempt failed, so callers can tell that apart from no match.
+        """
+        tasks = [asyncio.create_task(self._run_attempt(query, engine, q_variation)) for engine, q_variation in attempts]
+        failed = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                ai_result = await next_done
+                if ai_result and 'error' in ai_result:
+                    failed += 1
+                    continue
+                profile = await self._remember_profile(ai_result, query, search_key)
+                if profile:
+                    return [profile]
+        finally:
+            # Stop the slower searches once one has succeeded (or on error)
+            for task in tasks:
+                task.cancel()
         
+        return None if tasks and failed == len(tasks) else []
+
+    async def _run_attempt(self, query: str, engine: Dict, q_variation: str) -> Optional[Dict]:
+        """Search one engine/query variation and ask the AI about its result links"""
+        async with self.browser_pool.acquire_page() as page:
+            search_results = await self._fetch_search_results(page, engine, q_variation)
+        if search_results is None:
+            return {'error': f"{engine['engine']} search failed"}
+        if not search_results:
+            return None
+
+        # Send the structured data to OpenAI for analysis
+        logger.debug("Sending %d search results to OpenAI for analysis", len(search_results))
+        ai_result = await self._analyze_links(search_results, query)
+        logger.debug("AI Analysis Result: %s", ai_result)
+        if not ai_result.get('linkedin_url'):
+            logger.debug("AI did not find a relevant profile. Reasoning: %s", ai_result.get('reasoning'))
+        return ai_result
+
+    async def _fetch_search_results(self, page: Page, engine: Dict, q_variation: str) -> Optional[List[Dict]]:
+        """Run one search on the page and extract its result links; returns None on failure"""
         try:
-            # Using only Bing and the specific query format as requested
-            search_engines = [
-                {'engine': 'bing', 'url': 'https://www.bing.com/search'},
-            ]
-
-            query_variations = [
-                f'{query} linkedin',
-                f'{query} {self._extract_key_terms(self.current_patent_title)} linkedin'
-            ] if hasattr(self, 'current_patent_title') and self.current_patent_title else [f'{query} linkedin']
-
-            for engine in search_engines:
-                for i, q_variation in enumerate(query_variations):
-                    try:
-                        print(f"   Trying {engine['engine']} search with query: {q_variation}")
-                        
-                        # More robust search flow: navigate, fill, and submit
-                        await self.page.goto(engine['url'], wait_until='domcontentloaded', timeout=20000)
-                        
-                        # Handle consent pop-ups first
-                        await self._handle_consent_popups()
-
-                        # Fill the search box and submit
-                        search_box_selector = 'textarea[name="q"]'
-                        await self.page.wait_for_selector(search_box_selector, timeout=10000)
-                        search_box = self.page.locator(search_box_selector).first
-                        await search_box.fill(q_variation)
-                        
-                        # Wait for navigation after pressing Enter. This is crucial.
-                        await asyncio.gather(
-                            self.page.wait_for_load_state('domcontentloaded', timeout=15000),
-                            search_box.press('Enter')
-                        )
-                        
-                        # Save a debug screenshot of the results page
-                        screenshot_path = f"debug_{engine['engine']}_results_{i}.png"
-                        await self.page.screenshot(path=screenshot_path)
-                        print(f"   Saved debug screenshot to {screenshot_path}")
-
-                        # Extract structured search results from the page
-                        search_results = await self._extract_search_results_data()
-
-                        if not search_results:
-                            print("   Could not extract any search results from the page.")
-                            continue
-
-                        # Send the structured data to OpenAI for analysis
-                        print(f"   Sending {len(search_results)} search results to OpenAI for analysis...")
-                        ai_result = await self.openai_service.analyze_links_for_linkedin_url(search_results, query)
-                        print(f"   AI Analysis Result: {ai_result}")
-
-                        if ai_result and ai_result.get('linkedin_url'):
-                            profile = {
-                                'linkedin_url': ai_result['linkedin_url'],
-                                'name': query,
-                                'title': ai_result.get('reasoning'), # Use reasoning as title
-                            }
-                            return [profile]
-                        else:
-                            print(f"   AI did not find a relevant profile. Reasoning: {ai_result.get('reasoning')}")
-                            
-                    except Exception as e:
-                        print(f"   {engine['engine']} search failed for query '{q_variation}': {e}")
-                        screenshot_path = f"debug_{engine['engine']}_failure.png"
-                        await self.page.screenshot(path=screenshot_path)
-                        print(f"   Saved failure screenshot to {screenshot_path}")
-                        continue
+            logger.debug("Trying %s search with query: %s", engine['engine'], q_variation)
+        
+            # More robust search flow: navigate, fill, and submit
+            await page.goto(engine['url'], wait_until='domcontentloaded', timeout=20000)
+        
+            # Handle consent pop-ups first
+            await self._handle_consent_popups(page)
+
+            # Fill the search box and submit
+            search_box_selector = 'textarea[name="q"]'
+            await page.wait_for_selector(search_box_selector, timeout=10000)
+            search_box = page.locator(search_box_selector).first
+            await search_box.fill(q_variation)
+        
+            # Wait for navigation after pressing Enter. This is crucial.
+            await asyncio.gather(
+                page.wait_for_load_state('domcontentloaded', timeout=15000),
+                search_box.press('Enter')
+            )
+        
+            # Extract structured search results from the page
+            search_results = await self._extract_search_results_data(page)
+            if not search_results:
+                logger.debug("Could not extract any search results from the page")
+            return search_results
             
-            return []
-                
         except Exception as e:
-            print(f"Error in search: {e}")
-            return []
-    
-    async def _handle_consent_popups(self):
-        """Handles common consent pop-ups on search engines."""
-        consent_selectors = [
-            'button:has-text("Accept all")',
-            'button:has-text("I agree")',
-            'button:has-text("Reject all")',
-            'button:has-text("Alle akzeptieren")', # German for "Accept all"
-            '[aria-label="Accept all"]',
-            '[aria-label="Reject all"]',
-            '#L2AGLb', # Google's "I agree" button ID in some regions
-        ]
-        for selector in consent_selectors:
+            logger.warning("%s search failed for query '%s': %s", engine['engine'], q_variation, e)
+            # Screenshots are only taken on failure; they are slow to encode and transfer
+            screenshot_path = f"debug_{engine['engine']}_failure.png"
             try:
-                button = self.page.locator(selector).first
-                if await button.is_visible(timeout=2500):
-                    print(f"   Consent button found with selector '{selector}', clicking it...")
-                    await button.click()
-                    await self.page.wait_for_load_state('networkidle', timeout=5000)
-                    print("   Consent button clicked.")
-                    return # Exit after clicking one
-            except Exception:
-                # Selector not found or not visible, which is expected
-                continue
+                await page.screenshot(path=screenshot_path)
+                logger.info("Saved failure screenshot to %s", screenshot_path)
+            except Exception as screenshot_error:
+                logger.debug("Could not save failure screenshot: %s", screenshot_error)
+            return None
+
+    async def _remember_profile(self, ai_result: Dict, query: str, search_key: str) -> Optional[Dict]:
+        """Turn a positive AI result into a profile and cache it for the search"""
+        if not ai_result or not ai_result.get('linkedin_url'):
+            return None
+        profile = {
+            'linkedin_url': ai_result['linkedin_url'],
+            'name': query,
+            'title': ai_result.get('reasoning'), # Use reasoning as title
+        }
+        await self.cache.aset(search_key, [profile], SEARCH_CACHE_TTL)
+        return profile
+    
+    async def _lookup_link_analysis(self, search_results: List[Dict], query: str) -> Tuple[Optional[Dict], str, Optional[Any]]:
+        """Find a stored AI answer for an identical or near-identical query and link set"""
+        links_key = cache_key('links', query.lower(), *sorted(result['url'] for result in search_results))
+        ai_result = await self.cache.aget(links_key)
+        if ai_result is not None:
+            return ai_result, links_key, None
+
+        link_vector = None
+        if self.link_cache:
+            link_text = '\n'.join([query] + [result.get('title', '') for result in search_results[:10]])
+            link_vector = await self.link_cache.embed(link_text)
+            ai_result = self.link_cache.lookup(link_vector)
+            if ai_result is not None:
+                logger.debug("Reusing AI analysis of a near-identical result set")
+        return ai_result, links_key, link_vector
+
+    async def _store_link_analysis(self, ai_result: Dict, links_key: str, link_vector: Optional[Any]):
+        if 'error' not in ai_result:
+            await self.cache.aset(links_key, ai_result, SEARCH_CACHE_TTL)
+            if self.link_cache:
+                self.link_cache.store(link_vector, ai_result)
+
+    def _direct_profile_match(self, search_results: List[Dict], query: str) -> Optional[Dict]:
+        """
+        Skip the AI when the results contain exactly one LinkedIn profile link
+        and its title clearly names the person.
+        """
+        candidates = [result for result in search_results
+                      if 'linkedin.com' in result['url'] and '/in/' in result['url']]
+        if len(candidates) != 1:
+            return None
+        candidate = candidates[0]
+        if fuzz.token_set_ratio(candidate.get('title', ''), query, processor=fuzz_utils.default_process) < DIRECT_MATCH_MIN_SCORE:
+            return None
+        logger.debug("Single matching LinkedIn profile in results, skipping AI: %s", candidate['url'])
+        return {
+            'linkedin_url': candidate['url'],
+            'confidence': 'high',
+            'reasoning': f"Only LinkedIn profile in the results and its title matches: {candidate.get('title')}",
+        }
+
+    async def _analyze_links(self, search_results: List[Dict], query: str) -> Dict:
+        """Ask the AI which link is the profile, reusing earlier answers where possible"""
+        direct_result = self._direct_profile_match(search_results, query)
+        if direct_result:
+            return direct_result
+
+        ai_result, links_key, link_vector = await self._lookup_link_analysis(search_results, query)
+        if ai_result is None:
+            ai_result = await self.openai_service.analyze_links_for_linkedin_url(search_results, query)
+            await self._store_link_analysis(ai_result, links_key, link_vector)
+        return ai_result
+
+    async def _analyze_links_batch(self, requests: List[Tuple[List[Dict], str]]) -> List[Dict]:
+        """Like _analyze_links for several (search_results, query) pairs, with one AI call for all misses"""
+        async def lookup(links: List[Dict], query: str):
+            direct_result = self._direct_profile_match(links, query)
+            if direct_result:
+                return direct_result, None, None
+            return await self._lookup_link_analysis(links, query)
+
+        lookups = await asyncio.gather(*[lookup(links, query) for links, query in requests])
+        results = [ai_result for ai_result, _, _ in lookups]
+        misses = [i for i, ai_result in enumerate(results) if ai_result is None]
+        if misses:
+            logger.debug("Sending result links for %d inventors to OpenAI in one batch", len(misses))
+            ai_results = await self.openai_service.analyze_links_for_linkedin_urls_batch(
+                [{'query': requests[i][1], 'links': requests[i][0]} for i in misses]
+            )
+            for i, ai_result in zip(misses, ai_results):
+                _, links_key, link_vector = lookups[i]
+                await self._store_link_analysis(ai_result, links_key, link_vector)
+                results[i] = ai_result
+        return results
+
+    async def _handle_consent_popups(self, page: Page):
+        """Handles common consent pop-ups on search engines with a single in-page check."""
+        try:
+            clicked = await page.evaluate(_CONSENT_SCRIPT, _CONSENT_ARGS)
+            if clicked:
+                logger.debug("Consent button '%s' clicked", clicked)
+                await page.wait_for_load_state('domcontentloaded', timeout=5000)
+        except Exception as e:
+            # A consent click can navigate away mid-evaluate; the search flow continues either way
+            logger.debug("Consent handling skipped: %s", e)
 
     def _build_query_string(self, params: Dict) -> str:
         """Build query string from parameters"""
         import urllib.parse
         return urllib.parse.urlencode(params)
     
-    async def _extract_search_results_data(self) -> List[Dict]:
-        """Extracts all links from the page and sends them to the AI for analysis."""
-        print("   Extracting ALL links from page for AI analysis...")
+    async def _extract_search_results_data(self, page: Page) -> List[Dict]:
+        """Extracts the organic result links from the page for AI analysis."""
+        logger.debug("Extracting result links from page for AI analysis")
         
-        # This script grabs every link on the page, letting the AI do the filtering.
-        results = await self.page.evaluate("""() => {
-            const all_links = [];
-            document.querySelectorAll('a').forEach(link => {
-                if (link.href && link.innerText) {
-                    all_links.push({
-                        url: link.href,
-                        title: link.innerText.trim(),
-                        snippet: '' // Snippet is less critical when AI analyzes the full list
-                    });
-                }
-            });
-            return all_links;
-        }""")
+        # The DOM is read once and parsed off the event loop, keeping the shared renderer free
+        html = await page.content()
+        results = await asyncio.to_thread(_parse_result_links, html, page.url, MAX_RESULT_LINKS)
         
-        print(f"   Extracted {len(results)} total links from the page.")
+        logger.debug("Extracted %d result links from the page", len(results))
         
-        # Log the extracted search results to a file for debugging
-        try:
-            with open("search_results_log.json", "w") as f: # Overwrite with the latest search
-                f.write(f"--- New Search at {time.strftime('%Y-%m-%d %H:%M:%S')} ---\n")
-                json.dump(results, f, indent=2)
-                f.write("\n\n")
-            print("   Successfully logged all extracted links to search_results_log.json")
-        except Exception as e:
-            print(f"   Failed to log search results to file: {e}")
+        # Optionally log the extracted search results to a file for debugging, off the event loop
+        if DEBUG_LOG_LINKS:
+            await asyncio.to_thread(_write_links_log, results)
 
         return results
 
@@ -216,69 +458,128 @@ class LinkedInPlaywrightSearchService:
     
     def _extract_name_from_title(self, title: str) -> str:
         """Extract name from LinkedIn profile title"""
-        if not title:
-            return ''
-        
-        # LinkedIn titles usually have format: "Name - Title at Company | LinkedIn"
-        if ' - ' in title:
-            return title.split(' - ')[0].strip()
-        elif ' | LinkedIn' in title:
-            return title.split(' | LinkedIn')[0].strip()
-        else:
-            return title.strip()
+        return _extract_name_from_title(title) if title else ''
     
     async def find_linkedin_profiles(self, inventor_data: List[Dict]) -> List[Dict]:
         """
         Find LinkedIn profiles for multiple inventors using Playwright search
         
+        Each inventor is searched concurrently in its own pooled context, the
+        collected result links are analyzed by the AI in batches, and only
+        inventors still unmatched go on to try their other query variations.
+        
         Args:
             inventor_data: List of inventor dictionaries
             
         Returns:
             Enriched inventor data with LinkedIn information
         """
-        results = []
-        
-        for inventor in inventor_data:
-            print(f"🔍 Searching for: {inventor.get('name', 'Unknown')}")
-            
-            # Store patent title for query generation if available
-            self.current_patent_title = inventor.get('patent_title')
+        try:
+            self._check_ready()
+        except Exception as e:
+            return [{**inventor, 'linkedin_found': False, 'error': str(e)} for inventor in inventor_data]
 
-            try:
-                # The search_people method now handles query variations internally
-                profiles = await self.search_people(inventor.get('name', ''), limit=5)
+        semaphore = asyncio.Semaphore(self.browser_pool.size)
+        searches = await asyncio.gather(*[self._first_search(inventor, semaphore) for inventor in inventor_data])
 
-                best_match = None
-                best_score = 0
-                
-                for profile in profiles:
-                    score = self._calculate_match_score(profile, inventor)
-                    if score > best_score:
-                        best_score = score
-                        best_match = profile
-                
-                if best_match:
-                    results.append({
-                        **inventor,
-                        'linkedin_url': best_match.get('linkedin_url'),
-                        'linkedin_found': True,
-                        'match_score': best_score,
-                        'match_reasoning': best_match.get('title')
-                    })
-                else:
-                    results.append({**inventor, 'linkedin_found': False})
-
-            except Exception as e:
-                print(f"   An error occurred while searching for {inventor.get('name')}: {e}")
-                results.append({**inventor, 'linkedin_found': False, 'error': str(e)})
-            
-            finally:
-                # Clean up context for next inventor
-                if hasattr(self, 'current_patent_title'):
-                    del self.current_patent_title
+        # One AI call per batch of inventors for the links collected above
+        pending = [search for search in searches if search['profiles'] is None and search['links']]
+        batches = [pending[i:i + LINK_ANALYSIS_BATCH_SIZE] for i in range(0, len(pending), LINK_ANALYSIS_BATCH_SIZE)]
+        await asyncio.gather(*[self._analyze_search_batch(batch) for batch in batches])
+
+        # Inventors without a match fall back to their remaining query variations
+        await asyncio.gather(*[
+            self._retry_search(search, semaphore) for search in searches
+            if search['profiles'] is None and 'error' not in search
+        ])
+
+        return [self._match_inventor(search) for search in searches]
+
+    async def _first_search(self, inventor: Dict, semaphore: asyncio.Semaphore) -> Dict:
+        """Check the cache, or run the first search attempt for an inventor without asking the AI yet"""
+        query = inventor.get('name', '')
+        logger.info("Searching LinkedIn for: %s", query or 'Unknown')
+        search_key, attempts = self._search_plan(query, inventor.get('patent_title'))
+        search = {'inventor': inventor, 'query': query, 'search_key': search_key,
+                  'attempts': attempts, 'links': [], 'profiles': None}
+        if not _is_searchable_name(query):
+            logger.info("Skipping search for non-name query: %r", query)
+            search['profiles'] = []
+            return search
+        try:
+            cached_profiles = await self.cache.aget(search_key)
+            if cached_profiles is not None:
+                logger.debug("Using cached LinkedIn search result for: %s", query)
+                search['profiles'] = cached_profiles
+                return search
+
+            async with semaphore, self.browser_pool.acquire_page() as page:
+                engine, q_variation = attempts[0]
+                links = await self._fetch_search_results(page, engine, q_variation)
+            if links is None:
+                search['failure'] = f"{engine['engine']} search failed"
+            else:
+                search['links'] = links
+        except Exception as e:
+            logger.warning("An error occurred while searching for %s: %s", query, e)
+            search['error'] = str(e)
+        return search
+
+    async def _analyze_search_batch(self, batch: List[Dict]):
+        try:
+            ai_results = await self._analyze_links_batch([(search['links'], search['query']) for search in batch])
+            for search, ai_result in zip(batch, ai_results):
+                if 'error' in ai_result:
+                    search['failure'] = ai_result['error']
+                    continue
+                profile = await self._remember_profile(ai_result, search['query'], search['search_key'])
+                if profile:
+                    search['profiles'] = [profile]
+        except Exception as e:
+            logger.warning("Batched link analysis failed: %s", e)
+            for search in batch:
+                search['failure'] = str(e)
+
+    async def _retry_search(self, search: Dict, semaphore: asyncio.Semaphore):
+        remaining = search['attempts'][1:]
+        try:
+            profiles = None
+            if remaining:
+                async with semaphore:
+                    profiles = await self._search_attempts(search['query'], remaining, search['search_key'])
+            if profiles is not None:
+                search['profiles'] = profiles
+            elif 'failure' in search:
+                # Every attempt failed, so "not found" would be a guess
+                search['error'] = search['failure']
+        except Exception as e:
+            logger.warning("An error occurred while searching for %s: %s", search['query'], e)
+            search['error'] = str(e)
+
+    def _match_inventor(self, search: Dict) -> Dict:
+        """Enrich the inventor with the best-scoring profile found for it"""
+        inventor = search['inventor']
+        if 'error' in search:
+            return {**inventor, 'linkedin_found': False, 'error': search['error']}
+
+        best_match = None
+        best_score = 0
         
-        return results
+        for profile in search['profiles'] or []:
+            score = self._calculate_match_score(profile, inventor)
+            if score > best_score:
+                best_score = score
+                best_match = profile
+        
+        if best_match:
+            return {
+                **inventor,
+                'linkedin_url': best_match.get('linkedin_url'),
+                'linkedin_found': True,
+                'match_score': best_score,
+                'match_reasoning': best_match.get('title')
+            }
+        return {**inventor, 'linkedin_found': False}
     
     def _generate_search_queries(self, inventor: Dict) -> List[str]:
         """
@@ -305,13 +606,7 @@ class LinkedInPlaywrightSearchService:
         """
         Extracts key technical terms from a patent title.
         """
-        # Remove common words and keep technical terms
-        common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'system', 'method', 'apparatus', 'device'}
-        
-        words = patent_title.lower().split()
-        key_words = [word for word in words if word not in common_words and len(word) > 3]
-        
-        return ' '.join(key_words[:3])  # Return top 3 key terms
+        return _extract_key_terms(patent_title)
     
     def _calculate_match_score(self, profile: Dict, inventor: Dict) -> float:
         """Calculate how well a profile matches the inventor"""
@@ -340,17 +635,8 @@ class LinkedInPlaywrightSearchService:
         return min(score, 1.0)
     
     def _name_similarity(self, name1: str, name2: str) -> float:
-        """Calculate similarity between two names"""
-        words1 = set(name1.split())
-        words2 = set(name2.split())
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        
-        return len(intersection) / len(union)
+        """Calculate similarity between two names (token-set ratio, 0..1)"""
+        return fuzz.token_set_ratio(name1, name2) / 100.0
 
 
 # Test function
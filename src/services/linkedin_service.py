@@ -1,26 +1,194 @@
 # src/services/linkedin_service.py - LinkedIn Profile Discovery with Playwright
 
 import asyncio
+import functools
+import os
 import re
+import httpx
 from playwright.async_api import Page, Browser
-from typing import Dict, List, Optional, Tuple
+from services.browser_pool import PagePool, optimize_context
+from services.disk_cache import DiskCache, cache_key
+from services.rate_limiter import AsyncRateLimiter
+from utils import best_name_match
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple
 import time
 import urllib.parse
 
+# Headers for plain HTTP probes, so they look like the browser session
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+}
+
+# Search and profile results are reused for a week; misses are retried after a day
+PROFILE_CACHE_TTL = 7 * 24 * 3600
+PROFILE_NOT_FOUND_TTL = 24 * 3600
+# Table in the shared LinkedIn cache file that holds this finder's queries and profiles
+PROFILE_CACHE_TABLE = 'profile_finder'
+
+# LinkedIn answers non-browser clients with 999 (or 429 when throttled); those URLs are re-checked in the browser
+BOT_BLOCKED_STATUSES = frozenset({429, 999})
+
+# Logged-out visitors are redirected to, or shown, a sign-in/join wall instead of results
+_AUTH_WALL_URL_RE = re.compile(r'linkedin\.com/(authwall|login|signup|uas/login)')
+_AUTH_WALL_SCRIPT = """
+    () => !!document.querySelector('form[action*="login"], .authwall, a[href*="/signup"], a[href*="/login"]')
+"""
+
+# Punctuation stripped before comparing names or building profile slugs
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# Common technology terms looked for in patent titles, in priority order
+_TECH_TERMS = (
+    'algorithm', 'machine learning', 'artificial intelligence', 'neural network',
+    'software', 'hardware', 'processor', 'computing', 'database', 'network',
+    'wireless', 'mobile', 'internet', 'web', 'cloud', 'security', 'encryption',
+    'biotech', 'pharmaceutical', 'medical', 'therapeutic', 'genetic', 'dna',
+    'semiconductor', 'chip', 'circuit', 'electronic', 'optical', 'laser'
+)
+
+def clear_profile_cache():
+    """Remove the finder's cached queries and profiles from the LinkedIn cache file"""
+    cache = DiskCache(os.getenv("LINKEDIN_CACHE_PATH", "linkedin_cache.sqlite"), table=PROFILE_CACHE_TABLE)
+    try:
+        cache.clear()
+    finally:
+        cache.close()
+
+def _clean_name(name: str) -> str:
+    return _PUNCT_RE.sub('', name.lower()).strip()
+
+@functools.lru_cache(maxsize=4096)
+def _name_tokens(name_clean: str) -> frozenset:
+    return frozenset(name_clean.split())
+
+@functools.lru_cache(maxsize=4096)
+def _name_similarity(name1_clean: str, name2_clean: str) -> float:
+    name1_parts = _name_tokens(name1_clean)
+    name2_parts = _name_tokens(name2_clean)
+    
+    if not name1_parts or not name2_parts:
+        return 0.0
+    
+    # Exact match
+    if name1_clean == name2_clean:
+        return 1.0
+    
+    # Share of the shorter name's parts that appear in the longer name
+    return len(name1_parts & name2_parts) / min(len(name1_parts), len(name2_parts))
+
+@functools.lru_cache(maxsize=1024)
+def _tech_keywords(patent_lower: str) -> Tuple[str, ...]:
+    # Inventors of one patent share its title, so this mostly runs once per patent
+    return tuple(term for term in _TECH_TERMS if term in patent_lower)[:3]  # Up to 3 most relevant terms
+
+# Profile URLs whose slug is this similar to the inventor's name are worth opening;
+# a lone candidate scoring SLUG_ACCEPT_SCORE (every name part is a whole slug word)
+# is accepted without opening it
+SLUG_MIN_SCORE = 0.4
+SLUG_ACCEPT_SCORE = 1.0
+# Name parts at least this long also count, at half weight, as the start of a slug word
+# ('smith' in 'smithson'); shorter ones ('li', 'wu') start too many unrelated words
+SLUG_PREFIX_MIN_LENGTH = 3
+
+_SLUG_SPLIT_RE = re.compile(r'[^a-z]+')
+
+@functools.lru_cache(maxsize=4096)
+def _slug_similarity(slug: str, name_clean: str) -> Optional[float]:
+    """
+    Share of the name's parts (initials ignored) found as words of a /in/ slug
+    such as 'john-doe-12345' or 'johndoe'. Returns None when the slug can't be
+    judged: opaque member-ID slugs ('ACoAA...') and non-ASCII names, which
+    LinkedIn may transliterate.
+    """
+    slug = urllib.parse.unquote(slug)
+    if slug.startswith('ACoAA') or not name_clean.isascii():
+        return None
+    slug_words = [word for word in _SLUG_SPLIT_RE.split(slug.lower()) if word]
+    name_parts = [part for part in name_clean.split() if len(part) > 1]
+    if not slug_words or not name_parts:
+        return None
+    # 'johndoe' spells out the whole name as one word
+    if ''.join(name_parts) in slug_words or ''.join(reversed(name_parts)) in slug_words:
+        return 1.0
+    score = 0.0
+    for part in name_parts:
+        if part in slug_words:
+            score += 1
+        elif len(part) >= SLUG_PREFIX_MIN_LENGTH and any(word.startswith(part) for word in slug_words):
+            score += 0.5
+    return score / len(name_parts)
+
 class LinkedInProfileFinder:
-    def __init__(self, browser_context=None):
+    def __init__(self, browser_context=None, http_client: Optional[httpx.AsyncClient] = None,
+                 cache: Optional[DiskCache] = None):
         self.browser_context = browser_context
-        self.rate_limit_delay = 2  # Seconds between searches
+        self.http_client = http_client
+        self._owns_http_client = http_client is None
+        self.cache = cache
+        self._owns_cache = cache is None
+        # Be respectful to LinkedIn: at most 30 searches a minute, and no more than
+        # a few back to back (a cold start doesn't fire a whole minute's budget at once)
+        self.rate_limiter = AsyncRateLimiter(max_rate=30, time_period=60, max_burst=3)
         self.max_search_attempts = 3
+        self.max_concurrent_searches = 3
+        self.max_queries_per_inventor = 2
+        # Warm pages reused across searches and profile scoring instead of new_page()/close() each time
+        self.page_pool = PagePool(browser_context, max_pages=self.max_concurrent_searches) if browser_context else None
+        self._context_optimized = False
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        if self.http_client is None:
+            self.http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20),
+                timeout=httpx.Timeout(10.0)
+            )
+        return self.http_client
+    
+    def _get_cache(self) -> DiskCache:
+        if self.cache is None:
+            self.cache = DiskCache(os.getenv("LINKEDIN_CACHE_PATH", "linkedin_cache.sqlite"), table=PROFILE_CACHE_TABLE)
+        return self.cache
+    
+    async def close(self):
+        """Close the pooled pages, plus the HTTP client and cache if this finder created them"""
+        if self.page_pool:
+            await self.page_pool.close()
+        if self.http_client and self._owns_http_client:
+            await self.http_client.aclose()
+            self.http_client = None
+        if self.cache and self._owns_cache:
+            self.cache.close()
+            self.cache = None
         
     async def find_linkedin_profiles(self, inventor_data: List[Dict]) -> List[Dict]:
         """
-        Find LinkedIn profiles for multiple inventors
-        Returns enriched inventor data with LinkedIn URLs
+        Find LinkedIn profiles for multiple inventors, a few at a time
+        Returns enriched inventor data with LinkedIn URLs, in input order
         """
-        results = []
-        
-        for inventor in inventor_data:
+        semaphore = asyncio.Semaphore(self.max_concurrent_searches)
+        return list(await asyncio.gather(*[self._find_profile_for_inventor(inventor, semaphore) for inventor in inventor_data]))
+    
+    async def find_linkedin_profiles_streamed(self, inventors: AsyncIterable[Dict]) -> List[Dict]:
+        """
+        Like find_linkedin_profiles, but each inventor's search starts as soon as
+        it arrives from the stream (e.g. OpenAIService.stream_inventor_contacts)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_searches)
+        tasks = []
+        try:
+            async for inventor in inventors:
+                tasks.append(asyncio.create_task(self._find_profile_for_inventor(inventor, semaphore)))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return list(await asyncio.gather(*tasks))
+    
+    async def _find_profile_for_inventor(self, inventor: Dict, semaphore: asyncio.Semaphore) -> Dict:
+        """Find one inventor's profile while holding one of the concurrent search slots"""
+        async with semaphore:
             print(f"🔍 Searching LinkedIn for: {inventor.get('name', 'Unknown')}")
             
             try:
@@ -31,20 +199,14 @@ class LinkedInProfileFinder:
                 inventor_result['linkedin_url'] = linkedin_url
                 inventor_result['linkedin_found'] = linkedin_url is not None
                 
-                results.append(inventor_result)
-                
-                # Rate limiting - be respectful to LinkedIn
-                await asyncio.sleep(self.rate_limit_delay)
-                
             except Exception as e:
                 print(f"❌ LinkedIn search failed for {inventor.get('name')}: {e}")
                 inventor_result = inventor.copy()
                 inventor_result['linkedin_url'] = None
                 inventor_result['linkedin_found'] = False
                 inventor_result['linkedin_error'] = str(e)
-                results.append(inventor_result)
-        
-        return results
+            
+            return inventor_result
     
     async def _find_single_profile(self, inventor: Dict) -> Optional[str]:
         """Find LinkedIn profile for a single inventor"""
@@ -58,33 +220,57 @@ class LinkedInProfileFinder:
         if not search_queries:
             search_queries = self._generate_basic_search_queries(inventor)
         
-        # Try each search query until we find a good match
-        for query in search_queries[:self.max_search_attempts]:
-            try:
-                profile_url = await self._search_linkedin_for_query(query, inventor)
+        # Race the queries and take the first one that yields a match;
+        # the page pool still bounds how many pages hit LinkedIn at once
+        query_slots = asyncio.Semaphore(self.max_queries_per_inventor)
+        tasks = [
+            asyncio.ensure_future(self._run_search_query(query, inventor, query_slots))
+            for query in search_queries[:self.max_search_attempts]
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                profile_url = await next_done
                 if profile_url:
                     print(f"✅ Found LinkedIn profile: {profile_url}")
                     return profile_url
-                    
-                # Small delay between search attempts
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                print(f"⚠️  Search query '{query}' failed: {e}")
-                continue
+        finally:
+            for task in tasks:
+                task.cancel()
         
         print(f"❌ No LinkedIn profile found for {name}")
         return None
     
+    async def _run_search_query(self, query: str, inventor: Dict, query_slots: asyncio.Semaphore) -> Optional[str]:
+        """Run one search query for an inventor; failures count as no match"""
+        key = cache_key('query', query.lower(), inventor.get('name', '').lower(), inventor.get('company', '').lower())
+        cached = await self._get_cache().aget(key)
+        if cached is not None:
+            return cached['linkedin_url']
+        
+        async with query_slots:
+            try:
+                profile_url = await self._search_linkedin_for_query(query, inventor)
+            except Exception as e:
+                print(f"⚠️  Search query '{query}' failed: {e}")
+                return None
+        
+        # Failed searches are not cached, so they are retried on the next run
+        ttl = PROFILE_CACHE_TTL if profile_url else PROFILE_NOT_FOUND_TTL
+        await self._get_cache().aset(key, {'linkedin_url': profile_url}, ttl)
+        return profile_url
+    
     async def _search_linkedin_for_query(self, query: str, inventor: Dict) -> Optional[str]:
         """Search LinkedIn with a specific query and extract profile URL"""
         
-        if not self.browser_context:
+        if not self.page_pool:
             raise Exception("Browser context not available")
         
-        page = await self.browser_context.new_page()
+        # Block images/fonts/trackers once on the caller's context before the first navigation
+        if not self._context_optimized:
+            self._context_optimized = True
+            await optimize_context(self.browser_context)
         
-        try:
+        async with self.page_pool.acquire() as page:
             # Set up the page to look more human-like
             await page.set_extra_http_headers({
                 'Accept-Language': 'en-US,en;q=0.9',
@@ -96,14 +282,18 @@ class LinkedInProfileFinder:
             search_url = f"https://www.linkedin.com/search/results/people/?keywords={encoded_query}"
             
             print(f"🔍 Searching: {query}")
-            await page.goto(search_url, wait_until='networkidle', timeout=30000)
+            async with self.rate_limiter:
+                await page.goto(search_url, wait_until='domcontentloaded', timeout=15000)
             
-            # Wait for search results to load
-            await page.wait_for_timeout(3000)
+            # Wait for the first result links rather than for the network to go idle;
+            # if none show up the auth wall check below decides what to do
+            try:
+                await page.wait_for_selector('a[href*="/in/"]', timeout=5000)
+            except Exception:
+                pass
             
             # Check if we need to handle authentication/captcha
-            page_content = await page.content()
-            if 'Sign in' in page_content or 'Join LinkedIn' in page_content:
+            if _AUTH_WALL_URL_RE.search(page.url) or await page.evaluate(_AUTH_WALL_SCRIPT):
                 print("⚠️  LinkedIn requires authentication - switching to alternative method")
                 return await self._try_direct_profile_url(inventor, page)
             
@@ -125,9 +315,6 @@ class LinkedInProfileFinder:
             # Validate and rank the found profiles
             best_match = await self._find_best_profile_match(profile_links, inventor, page)
             return best_match
-            
-        finally:
-            await page.close()
     
     async def _find_best_profile_match(self, profile_urls: List[str], inventor: Dict, page: Page) -> Optional[str]:
         """Analyze found profiles to find the best match"""
@@ -136,9 +323,19 @@ class LinkedInProfileFinder:
         company = inventor.get('company', '').lower()
         patent_title = inventor.get('patent_title', '').lower()
         
+        # Drop URLs whose slug clearly names someone else before opening any page
+        name_clean = _clean_name(inventor_name)
+        slug_scores = {
+            url: _slug_similarity(url.split('/in/')[-1].split('/')[0], name_clean)
+            for url in profile_urls
+        }
+        candidates = [url for url, slug_score in slug_scores.items() if slug_score is None or slug_score > SLUG_MIN_SCORE]
+        if len(candidates) == 1 and (slug_scores[candidates[0]] or 0) >= SLUG_ACCEPT_SCORE:
+            return candidates[0]
+        
         scored_profiles = []
         
-        for url in profile_urls[:3]:  # Check top 3 profiles
+        for url in candidates[:3]:  # Check top 3 profiles
             try:
                 score = await self._score_profile_match(url, inventor_name, company, patent_title, page)
                 scored_profiles.append((url, score))
@@ -163,42 +360,14 @@ class LinkedInProfileFinder:
         """Score how well a LinkedIn profile matches the inventor"""
         
         try:
-            # Navigate to the profile (just get basic info from URL and preview)
-            await page.goto(profile_url, wait_until='domcontentloaded', timeout=15000)
-            await page.wait_for_timeout(2000)
-            
-            # Get visible profile information
-            profile_info = await page.evaluate("""
-                () => {
-                    const getName = () => {
-                        const selectors = ['h1', '.text-heading-xlarge', '.pv-text-details__left-panel h1'];
-                        for (const selector of selectors) {
-                            const element = document.querySelector(selector);
-                            if (element && element.textContent) {
-                                return element.textContent.trim();
-                            }
-                        }
-                        return '';
-                    };
-                    
-                    const getHeadline = () => {
-                        const selectors = ['.text-body-medium', '.pv-text-details__left-panel .text-body-medium'];
-                        for (const selector of selectors) {
-                            const element = document.querySelector(selector);
-                            if (element && element.textContent) {
-                                return element.textContent.trim();
-                            }
-                        }
-                        return '';
-                    };
-                    
-                    return {
-                        name: getName(),
-                        headline: getHeadline(),
-                        pageText: document.body.innerText.toLowerCase()
-                    };
-                }
-            """)
+            patent_keywords = self._extract_tech_keywords(patent_title) if patent_title else []
+            key = cache_key('profile', profile_url, company, *patent_keywords)
+            profile_info = await self._get_cache().aget(key)
+            if profile_info is None:
+                profile_info = await self._fetch_profile_info(profile_url, company, patent_keywords, page)
+                # An empty name usually means an auth wall, which is worth retrying later
+                if profile_info.get('name'):
+                    await self._get_cache().aset(key, profile_info, PROFILE_CACHE_TTL)
             
             # Calculate match score
             score = 0.0
@@ -210,19 +379,12 @@ class LinkedInProfileFinder:
                 score += name_similarity * 0.6  # 60% weight for name match
             
             # Company matching
-            page_text = profile_info.get('pageText', '')
-            headline = profile_info.get('headline', '').lower()
-            
-            if company and (company in page_text or company in headline):
+            if profile_info.get('companyMatch'):
                 score += 0.3  # 30% weight for company match
             
             # Technology/patent context matching
-            if patent_title:
-                patent_keywords = self._extract_tech_keywords(patent_title)
-                for keyword in patent_keywords:
-                    if keyword in page_text or keyword in headline:
-                        score += 0.1  # Small bonus for tech relevance
-                        break
+            if profile_info.get('techMatches'):
+                score += 0.1  # Small bonus for tech relevance
             
             return min(score, 1.0)  # Cap at 1.0
             
@@ -230,80 +392,94 @@ class LinkedInProfileFinder:
             print(f"❌ Error accessing profile {profile_url}: {e}")
             return 0.0
     
+    async def _fetch_profile_info(self, profile_url: str, company: str, patent_keywords: List[str], page: Page) -> Dict:
+        """Open a profile and read its name and headline plus company/keyword matches"""
+        
+        # Navigate to the profile (just get basic info from URL and preview)
+        await page.goto(profile_url, wait_until='domcontentloaded', timeout=15000)
+        try:
+            await page.wait_for_selector('h1', timeout=3000)
+        except Exception:
+            pass
+        
+        # Get visible profile information; company/keyword matching runs in the
+        # page so only small results cross CDP instead of the whole page text
+        profile_info = await page.evaluate("""
+            ([company, keywords]) => {
+                const nameEl = document.querySelector('h1, .text-heading-xlarge');
+                const headlineEl = document.querySelector('.text-body-medium');
+                const headline = headlineEl?.textContent.trim() || '';
+                const hay = (document.body.innerText || '').toLowerCase() + ' ' + headline.toLowerCase();
+                return {
+                    name: nameEl?.textContent.trim() || '',
+                    headline: headline,
+                    companyMatch: company ? hay.includes(company) : false,
+                    techMatches: keywords.filter(keyword => hay.includes(keyword))
+                };
+            }
+        """, [company, patent_keywords])
+        return profile_info
+    
     def _calculate_name_similarity(self, name1: str, name2: str) -> float:
         """Calculate similarity between two names"""
-        
-        # Clean names
-        name1_clean = re.sub(r'[^\w\s]', '', name1.lower()).strip()
-        name2_clean = re.sub(r'[^\w\s]', '', name2.lower()).strip()
-        
-        name1_parts = name1_clean.split()
-        name2_parts = name2_clean.split()
-        
-        if not name1_parts or not name2_parts:
-            return 0.0
-        
-        # Exact match
-        if name1_clean == name2_clean:
-            return 1.0
-        
-        # Check if all parts of the shorter name are in the longer name
-        shorter = name1_parts if len(name1_parts) <= len(name2_parts) else name2_parts
-        longer = name2_parts if len(name1_parts) <= len(name2_parts) else name1_parts
-        
-        matches = 0
-        for part in shorter:
-            if part in longer:
-                matches += 1
-        
-        return matches / len(shorter) if shorter else 0.0
+        return _name_similarity(_clean_name(name1), _clean_name(name2))
     
     def _extract_tech_keywords(self, patent_title: str) -> List[str]:
         """Extract relevant technology keywords from patent title"""
-        
-        # Common technology terms to look for
-        tech_terms = [
-            'algorithm', 'machine learning', 'artificial intelligence', 'neural network',
-            'software', 'hardware', 'processor', 'computing', 'database', 'network',
-            'wireless', 'mobile', 'internet', 'web', 'cloud', 'security', 'encryption',
-            'biotech', 'pharmaceutical', 'medical', 'therapeutic', 'genetic', 'dna',
-            'semiconductor', 'chip', 'circuit', 'electronic', 'optical', 'laser'
-        ]
-        
-        patent_lower = patent_title.lower()
-        found_terms = []
-        
-        for term in tech_terms:
-            if term in patent_lower:
-                found_terms.append(term)
-        
-        return found_terms[:3]  # Return up to 3 most relevant terms
+        return list(_tech_keywords(patent_title.lower()))
     
     async def _try_direct_profile_url(self, inventor: Dict, page: Page) -> Optional[str]:
-        """Try to access predicted LinkedIn URLs directly"""
+        """
+        Try to access predicted LinkedIn URLs directly. Raises when no check got an
+        answer from LinkedIn (network errors or blocked everywhere), so the miss isn't cached.
+        """
         
         predicted_urls = inventor.get('predicted_linkedin_urls', [])
         if not predicted_urls:
             predicted_urls = self._generate_predicted_urls(inventor.get('name', ''))
         
-        for url in predicted_urls[:3]:  # Try top 3 predictions
+        full_urls = [f"https://{url}" if not url.startswith('http') else url for url in predicted_urls[:3]]  # Try top 3 predictions
+        if not full_urls:
+            return None
+        
+        # Probe all predictions at once over plain HTTP; a full page load is only needed when LinkedIn refuses non-browser clients
+        responses = await asyncio.gather(*[self._probe_profile_url(url) for url in full_urls])
+        for url, (status, is_profile) in zip(full_urls, responses):
+            if status == 200 and is_profile:
+                return url
+        answered = any(status is not None and status not in BOT_BLOCKED_STATUSES for status, _ in responses)
+        
+        for url, (status, _) in zip(full_urls, responses):
+            if status not in BOT_BLOCKED_STATUSES:
+                continue
             try:
-                full_url = f"https://{url}" if not url.startswith('http') else url
-                
-                response = await page.goto(full_url, wait_until='domcontentloaded', timeout=10000)
+                response = await page.goto(url, wait_until='domcontentloaded', timeout=10000)
+                if response and response.status not in BOT_BLOCKED_STATUSES:
+                    answered = True
                 
                 if response and response.status == 200:
                     # Check if it's a valid profile page
                     page_content = await page.content()
                     if 'linkedin.com/in/' in page_content and 'Profile' in page_content:
-                        return full_url
+                        return url
                         
             except Exception as e:
                 print(f"❌ Direct URL check failed for {url}: {e}")
                 continue
         
+        if not answered:
+            raise Exception("No direct profile URL check got an answer from LinkedIn")
         return None
     
+    async def _probe_profile_url(self, url: str) -> Tuple[Optional[int], bool]:
+        """GET a predicted profile URL; returns (status, looks_like_profile), status None on network errors"""
+        try:
+            response = await self._get_http_client().get(url, headers=BROWSER_HEADERS, follow_redirects=True)
+            return response.status_code, 'linkedin.com/in/' in response.text and 'Profile' in response.text
+        except httpx.HTTPError as e:
+            print(f"❌ Direct URL check failed for {url}: {e}")
+            return None, False
+    
     def _generate_predicted_urls(self, name: str) -> List[str]:
         """Generate predicted LinkedIn URLs from name"""
         
@@ -311,8 +487,7 @@ class LinkedInProfileFinder:
             return []
         
         # Clean name
-        clean_name = re.sub(r'[^\w\s]', '', name.lower()).strip()
-        name_parts = clean_name.split()
+        name_parts = _clean_name(name).split()
         
         if len(name_parts) < 2:
             return []
@@ -367,17 +542,13 @@ class EnhancedPatentService:
         # Step 1: Extract patent data
         patent_data = await self.patent_service.extract_patent_data(patent_number)
         
-        # Step 2: Get OpenAI contact analysis
-        if self.openai_service:
-            contact_analysis = self.openai_service.analyze_inventor_contacts(patent_data)
-        else:
-            contact_analysis = []
-        
-        # Step 3: Find LinkedIn profiles if requested
-        if include_linkedin and contact_analysis:
-            enriched_inventors = await self.linkedin_finder.find_linkedin_profiles(contact_analysis)
+        # Steps 2+3: stream the OpenAI contact analysis straight into the LinkedIn
+        # search, so the first inventor is being searched while later ones are generated
+        inventors = self._analyzed_inventors(patent_data)
+        if include_linkedin:
+            enriched_inventors = await self.linkedin_finder.find_linkedin_profiles_streamed(inventors)
         else:
-            enriched_inventors = contact_analysis
+            enriched_inventors = [inventor async for inventor in inventors]
         
         # Step 4: Combine all data
         result = {
@@ -391,6 +562,29 @@ class EnhancedPatentService:
         }
         
         return result
+    
+    async def _analyzed_inventors(self, patent_data: Dict) -> AsyncIterator[Dict]:
+        """Yield each inventor, with its contact analysis when available, in the finder's input shape"""
+        base = {
+            'company': patent_data.get('assignee', ''),
+            'patent_title': patent_data.get('title', ''),
+        }
+        if not self.openai_service:
+            for name in patent_data.get('inventors', []):
+                yield {'name': name, **base}
+            return
+        
+        analyzed_names = []
+        async for analysis in self.openai_service.stream_inventor_contacts(patent_data):
+            if 'error' in analysis:
+                # The analysis failed part-way; inventors it hadn't reached are searched by bare name
+                print(f"⚠️  Contact analysis failed, searching the remaining inventors by name: {analysis['error']}")
+                for name in patent_data.get('inventors', []):
+                    if best_name_match(name, analyzed_names) is None:
+                        yield {'name': name, **base}
+                return
+            analyzed_names.append(analysis.get('name', ''))
+            yield {**base, **analysis, 'linkedin_search_queries': analysis.get('linkedin_search_terms', [])}
 
 
 # Testing function
@@ -437,6 +631,7 @@ async def test_linkedin_finder(custom_name: str = None):
         
         print(f"🔍 Testing LinkedIn finder for: {test_inventors[0]['name']}")
         results = await finder.find_linkedin_profiles(test_inventors)
+        await finder.close()
         
         for result in results:
             print(f"\nInventor: {result['name']}")
@@ -1,37 +1,60 @@
+import asyncio
+import functools
 import os
+import re
+import httpx
 import openai
-from typing import Dict, List
+import orjson
+from typing import AsyncIterator, Dict, List, Optional
 import json
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-class OpenAIService:
-    def __init__(self, api_key: str = None):
-        """Initializes the OpenAI service with an API key."""
-        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
-            raise ValueError("OPENAI_API_KEY environment variable not set.")
-        openai.api_key = self.api_key
+# Process-wide service for callers that are not handed one explicitly, and whether
+# it was created here (and so owns its keep-alive pool) rather than registered by the app
+_default_openai_service: Optional["OpenAIService"] = None
+_default_owns_client = False
 
-    def _build_contact_analysis_prompt(self, patent_data: Dict) -> str:
-        """Builds the detailed prompt for contact analysis based on patent data."""
-        patent_number = patent_data.get('patent_number', 'N/A')
-        title = patent_data.get('title', 'N/A')
-        assignee = patent_data.get('assignee', 'N/A')
-        inventors = ", ".join(patent_data.get('inventors', []))
-        
-        # A simple keyword-based tech domain extraction
-        tech_domain = "General"
-        if any(keyword in title.lower() for keyword in ['software', 'system', 'method', 'database']):
-            tech_domain = "Software/IT"
-        elif any(keyword in title.lower() for keyword in ['biotech', 'medical', 'dna']):
-            tech_domain = "Biotech/Medical"
-        elif any(keyword in title.lower() for keyword in ['gaming', 'device', 'hardware']):
-            tech_domain = "Hardware/Gaming"
-
-        return f"""
+def get_default_openai_service() -> "OpenAIService":
+    """Return the shared OpenAIService, creating it (with its own keep-alive pool) on first use"""
+    global _default_openai_service, _default_owns_client
+    if _default_openai_service is None:
+        _default_openai_service = OpenAIService(http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=50),
+            timeout=httpx.Timeout(60.0)
+        ))
+        _default_owns_client = True
+    return _default_openai_service
+
+def set_default_openai_service(service: Optional["OpenAIService"]):
+    """Register an application-owned instance as the shared default"""
+    global _default_openai_service, _default_owns_client
+    _default_openai_service = service
+    _default_owns_client = False
+
+async def close_default_openai_service():
+    """Forget the shared service, closing its keep-alive pool if get_default_openai_service created it"""
+    global _default_openai_service, _default_owns_client
+    service, owns_client = _default_openai_service, _default_owns_client
+    _default_openai_service, _default_owns_client = None, False
+    if service and owns_client:
+        await service.close()
+
+# A simple keyword-based tech domain extraction; the first matching rule wins
+_TECH_DOMAIN_RULES = (
+    (re.compile(r'software|system|method|database'), "Software/IT"),
+    (re.compile(r'biotech|medical|dna'), "Biotech/Medical"),
+    (re.compile(r'gaming|device|hardware'), "Hardware/Gaming"),
+)
+
+@functools.lru_cache(maxsize=512)
+def _classify_tech_domain(title_lower: str) -> str:
+    return next((domain for pattern, domain in _TECH_DOMAIN_RULES if pattern.search(title_lower)), "General")
+
+# Static prompt skeleton; only the patent fields are filled in per call
+_CONTACT_ANALYSIS_PROMPT = """
         ANALYZE INVENTOR FOR CONTACT STRATEGY
 
         **Patent Information:**
@@ -72,20 +95,206 @@ class OpenAIService:
         Now, analyze the provided patent information and generate the JSON output for ALL inventors listed.
         """
 
+# Same task for several patents in one request; inventors are grouped per patent
+_CONTACT_ANALYSIS_BATCH_PROMPT = """
+        ANALYZE INVENTORS OF SEVERAL PATENTS FOR CONTACT STRATEGY
+
+        **Patents (JSON):**
+        {patents}
+
+        **Your Task:**
+        For each inventor of each patent, generate a contact-finding strategy. Analyze their name, the patent's technology, and the assignee company to suggest the best ways to find their contact information.
+
+        **Analysis Framework:**
+        1.  **Name Analysis:** How common is the name? Unique names are easier to find.
+        2.  **Technology Context:** A software patent suggests a strong GitHub presence. A biotech patent points towards academic papers or ResearchGate.
+        3.  **Company Context:** An inventor at a large corporation (e.g., Apple) is harder to contact directly than one at a university or startup.
+
+        **Required Output Format:**
+        You MUST return a single valid JSON object. Do not include any text or formatting outside of this JSON object.
+        The JSON object should have a single key "results", a list with one object per patent containing:
+        - `patent_number`: The patent number exactly as given.
+        - `inventors`: A list with one object per inventor of that patent, each with the keys `name`, `email_suggestions` (3-5 email patterns), `linkedin_search_terms` (2-3 LinkedIn queries), `github_search_terms` (empty unless software-related), `confidence_score` (0.0-1.0) and `search_strategy` (1-2 sentences).
+
+        **Example:**
+        {{
+            "results": [
+                {{
+                    "patent_number": "US1234567",
+                    "inventors": [
+                        {{
+                            "name": "Lawrence Page",
+                            "email_suggestions": ["larry.page@google.com", "lpage@google.com", "larry@google.com"],
+                            "linkedin_search_terms": ["Lawrence Page Google Founder", "Larry Page Alphabet CEO"],
+                            "github_search_terms": [],
+                            "confidence_score": 0.4,
+                            "search_strategy": "High-profile executive, so direct contact is difficult. Focus on documented corporate history and public appearances rather than direct outreach."
+                        }}
+                    ]
+                }}
+            ]
+        }}
+
+        Now, analyze the provided patents and generate the JSON output for ALL patents and ALL inventors listed.
+        """
+
+_CONTACT_SYSTEM_PROMPT = "You are an expert contact research assistant. Your task is to analyze patent data and provide actionable strategies for finding inventor contact information in a structured JSON format."
+
+class _JSONArrayStream:
+    """
+    Pulls complete items out of the JSON array under `key` while the document
+    is still streaming in, so each item can be used as soon as it closes.
+    """
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, key: str):
+        self._key_re = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+        self._buffer = ''
+        self._pos: Optional[int] = None
+        self.done = False
+
+    def feed(self, text: str) -> List:
+        """Append streamed text and return the array items completed by it"""
+        self._buffer += text
+        items = []
+        if self._pos is None:
+            match = self._key_re.search(self._buffer)
+            if not match:
+                return items
+            self._pos = match.end()
+
+        while not self.done:
+            pos = self._pos
+            while pos < len(self._buffer) and self._buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= len(self._buffer):
+                break
+            if self._buffer[pos] == ']':
+                self.done = True
+                break
+            try:
+                item, self._pos = self._decoder.raw_decode(self._buffer, pos)
+            except ValueError:
+                break  # Item not complete yet
+            items.append(item)
+        return items
+
+# Worked examples of the /posts/ -> /in/ rewrite so the small link model applies it reliably
+_LINK_ANALYSIS_EXAMPLES = """
+Examples:
+1. Target "John Doe"; result {"url": "https://www.linkedin.com/posts/john-doe-12345_some-activity", "title": "John Doe on LinkedIn: Excited to share..."}
+   -> {"linkedin_url": "https://www.linkedin.com/in/john-doe-12345", "confidence": "high", "reasoning": "The post is by John Doe, so its author slug gives the profile URL."}
+2. Target "Maria Garcia"; results {"url": "https://www.linkedin.com/in/maria-garcia-phd", "title": "Maria Garcia, PhD - Research Scientist - Genentech | LinkedIn"} and {"url": "https://www.linkedin.com/posts/acme-corp_hiring-activity", "title": "Acme Corp on LinkedIn: We're hiring"}
+   -> {"linkedin_url": "https://www.linkedin.com/in/maria-garcia-phd", "confidence": "high", "reasoning": "Direct profile whose title names Maria Garcia; the company post is not hers."}
+3. Target "Wei Zhang"; result {"url": "https://www.linkedin.com/pulse/future-of-ai-jane-roe", "title": "The Future of AI - Jane Roe"}
+   -> {"linkedin_url": null, "confidence": "none", "reasoning": "The only result is an article by someone else."}
+"""
+
+_LINK_ANALYSIS_SYSTEM_PROMPT = "You are an expert data analyst. Your task is to analyze a JSON list of search results and return a structured JSON response identifying the correct LinkedIn URL.\n" + _LINK_ANALYSIS_EXAMPLES
+
+_LINK_ANALYSIS_BATCH_SYSTEM_PROMPT = "You are an expert data analyst. Your task is to analyze JSON lists of search results for several people and return a structured JSON response identifying each person's LinkedIn URL.\n" + _LINK_ANALYSIS_EXAMPLES
+
+# Small-model link analyses go to the larger model only when unsure or failed;
+# a "none" (no profile among the links) is accepted as is
+def _needs_second_opinion(result: Dict) -> bool:
+    return "error" in result or result.get("confidence", "low") == "low"
+
+# Patents analyzed per chat completion by analyze_inventor_contacts_batch
+CONTACT_BATCH_SIZE = 8
+
+class OpenAIService:
+    # Picking a URL out of search results is a small structural task; the larger
+    # model is only consulted when the small one is not confident
+    LINK_MODEL = "gpt-4o-mini"
+    LINK_FALLBACK_MODEL = "gpt-4o"
+
+    def __init__(self, api_key: str = None, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Initializes the OpenAI service with an API key.
+
+        A single AsyncOpenAI client is kept for the lifetime of the service so that
+        keep-alive connections and TLS sessions are reused across calls. Pass a
+        shared `http_client` to pool connections with the rest of the app.
+        """
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        if not self.api_key:
+            raise ValueError("OPENAI_API_KEY environment variable not set.")
+        openai.api_key = self.api_key
+        self.client = openai.AsyncOpenAI(api_key=self.api_key, http_client=http_client)
+
+    async def close(self):
+        """Closes the underlying HTTP client."""
+        await self.client.close()
+
+    def _build_contact_analysis_prompt(self, patent_data: Dict) -> str:
+        """Builds the detailed prompt for contact analysis based on patent data."""
+        title = patent_data.get('title', 'N/A')
+        return _CONTACT_ANALYSIS_PROMPT.format(
+            patent_number=patent_data.get('patent_number', 'N/A'),
+            title=title,
+            assignee=patent_data.get('assignee', 'N/A'),
+            tech_domain=_classify_tech_domain(title.lower()),
+            inventors=", ".join(patent_data.get('inventors', [])),
+        )
+
     async def analyze_inventor_contacts(self, patent_data: Dict) -> Dict:
         """
         Analyzes patent data to generate contact-finding strategies for each inventor.
         Returns a structured dictionary with contact leads.
         """
-        prompt = self._build_contact_analysis_prompt(patent_data)
-        
+        return (await self.analyze_inventor_contacts_batch([patent_data]))[0]
+
+    async def analyze_inventor_contacts_batch(self, patents: List[Dict]) -> List[Dict]:
+        """
+        Contact analysis for several patents, CONTACT_BATCH_SIZE patents per
+        chat completion. Returns one {"inventors": [...]} (or {"error": ...})
+        dict per patent, in input order.
+        """
+        batches = [patents[i:i + CONTACT_BATCH_SIZE] for i in range(0, len(patents), CONTACT_BATCH_SIZE)]
+        results = await asyncio.gather(*[self._analyze_contacts_batch(batch) for batch in batches])
+        return [analysis for batch_results in results for analysis in batch_results]
+
+    async def _analyze_contacts_batch(self, patents: List[Dict]) -> List[Dict]:
+        # A single patent keeps the original single-patent prompt and response shape
+        if len(patents) == 1:
+            analysis = await self._request_contact_analysis(self._build_contact_analysis_prompt(patents[0]))
+            return [analysis]
+
+        analysis = await self._request_contact_analysis(self._build_contact_analysis_batch_prompt(patents))
+        if "error" in analysis:
+            return [analysis for _ in patents]
+
+        items = [item for item in analysis.get("results", []) if isinstance(item, dict)]
+        by_number = {str(item.get("patent_number")): item for item in items}
+        results = []
+        for i, patent in enumerate(patents):
+            item = by_number.get(str(patent.get('patent_number')))
+            if item is None and len(items) == len(patents):
+                item = items[i]
+            results.append({"inventors": item.get("inventors", [])} if item else {"error": "Patent missing from batch analysis."})
+        return results
+
+    def _build_contact_analysis_batch_prompt(self, patents: List[Dict]) -> str:
+        """Builds one prompt covering several patents."""
+        patent_info = [
+            {
+                "patent_number": patent.get('patent_number', 'N/A'),
+                "title": patent.get('title', 'N/A'),
+                "assignee": patent.get('assignee', 'N/A'),
+                "technology_domain": _classify_tech_domain(patent.get('title', 'N/A').lower()),
+                "inventors": patent.get('inventors', []),
+            }
+            for patent in patents
+        ]
+        return _CONTACT_ANALYSIS_BATCH_PROMPT.format(patents=orjson.dumps(patent_info).decode())
+
+    async def _request_contact_analysis(self, prompt: str) -> Dict:
         try:
-            # Use the async client for async operations
-            async_client = openai.AsyncOpenAI(api_key=self.api_key)
-            response = await async_client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-4o",
                 messages=[
-                    {"role": "system", "content": "You are an expert contact research assistant. Your task is to analyze patent data and provide actionable strategies for finding inventor contact information in a structured JSON format."},
+                    {"role": "system", "content": _CONTACT_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 response_format={"type": "json_object"},
@@ -93,7 +302,7 @@ class OpenAIService:
             )
             
             analysis_text = response.choices[0].message.content
-            return json.loads(analysis_text)
+            return orjson.loads(analysis_text)
 
         except openai.APIError as e:
             print(f"OpenAI API Error: {e}")
@@ -102,6 +311,48 @@ class OpenAIService:
             print(f"An unexpected error occurred: {e}")
             return {"error": "An unexpected error occurred."}
 
+    async def stream_inventor_contacts(self, patent_data: Dict) -> AsyncIterator[Dict]:
+        """
+        Same analysis as analyze_inventor_contacts, but streamed: yields each
+        inventor's contact strategy as soon as the model has finished writing it,
+        so downstream searches can start while later inventors are generated.
+        A failure is logged and ends the stream with an {"error": ...} item, so
+        consumers can tell it apart from an analysis that found no inventors.
+        """
+        parser = _JSONArrayStream("inventors")
+        try:
+            stream = await self.client.chat.completions.create(
+                model="gpt-4o",
+                messages=[
+                    {"role": "system", "content": _CONTACT_SYSTEM_PROMPT},
+                    {"role": "user", "content": self._build_contact_analysis_prompt(patent_data)}
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.5,
+                stream=True,
+            )
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    for inventor in parser.feed(delta):
+                        if isinstance(inventor, dict):
+                            yield inventor
+
+        except openai.APIError as e:
+            print(f"OpenAI API Error: {e}")
+            yield {"error": f"OpenAI API Error: {e}"}
+        except Exception as e:
+            print(f"An unexpected error occurred: {e}")
+            yield {"error": f"An unexpected error occurred: {e}"}
+
+    async def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Returns one embedding per input text, used by the semantic cache."""
+        response = await self.client.embeddings.create(
+            model="text-embedding-3-small",
+            input=texts,
+        )
+        return [item.embedding for item in response.data]
+
     async def analyze_html_for_linkedin_url(self, html_content: str, target_name: str) -> Dict:
         # This function is now deprecated in favor of analyze_links_for_linkedin_url
         print("WARNING: analyze_html_for_linkedin_url is deprecated.")
@@ -122,11 +373,11 @@ class OpenAIService:
 
         **Search Results (JSON):**
         ```json
-        {json.dumps(search_results, indent=2)}
+        {orjson.dumps(search_results).decode()}
         ```
 
         **Instructions:**
-        1.  Examine the list of search results. Each result has a `url`, a `title`, and a `snippet`.
+        1.  Examine the list of search results. Each result has a `url` and a `title`, and may have a `snippet`.
         2.  Your goal is to identify the result that is most likely the correct LinkedIn profile for "{target_name}". The final URL you return **must** start with `https://www.linkedin.com/in/`.
         3.  The `title` and `snippet` are the most important clues. They often contain the person's name, job title, or company.
         4.  **URL Transformation Rule**: Some links may point to a LinkedIn **post** (e.g., a URL containing `/posts/`) or an article. If you determine a post belongs to the target person, you **must transform** the post URL into its corresponding profile URL.
@@ -152,12 +403,18 @@ class OpenAIService:
         Now, analyze the provided JSON data and find the best LinkedIn URL.
         """
         
+        result = await self._analyze_links(prompt, self.LINK_MODEL)
+        if _needs_second_opinion(result):
+            # The small model was unsure (or failed); let the larger one take a look
+            result = await self._analyze_links(prompt, self.LINK_FALLBACK_MODEL)
+        return result
+
+    async def _analyze_links(self, prompt: str, model: str) -> Dict:
         try:
-            async_client = openai.AsyncOpenAI(api_key=self.api_key)
-            response = await async_client.chat.completions.create(
-                model="gpt-4o",
+            response = await self.client.chat.completions.create(
+                model=model,
                 messages=[
-                    {"role": "system", "content": "You are an expert data analyst. Your task is to analyze a JSON list of search results and return a structured JSON response identifying the correct LinkedIn URL."},
+                    {"role": "system", "content": _LINK_ANALYSIS_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 response_format={"type": "json_object"},
@@ -165,7 +422,7 @@ class OpenAIService:
             )
             
             analysis_text = response.choices[0].message.content
-            return json.loads(analysis_text)
+            return orjson.loads(analysis_text)
 
         except Exception as e:
             print(f"An unexpected error occurred during link analysis: {e}")
@@ -173,8 +430,86 @@ class OpenAIService:
                 "linkedin_url": None,
                 "confidence": "none",
                 "reasoning": f"An exception occurred: {e}",
+                "error": str(e),
             }
 
+    async def analyze_links_for_linkedin_urls_batch(self, requests: List[Dict]) -> List[Dict]:
+        """
+        Batched variant of analyze_links_for_linkedin_url: takes
+        [{"query": name, "links": search_results}, ...] and returns one
+        {linkedin_url, confidence, reasoning} dict per request, in order.
+        """
+        results = await self._analyze_links_batch(requests, self.LINK_MODEL)
+        retry = [i for i, result in enumerate(results) if _needs_second_opinion(result)]
+        if retry:
+            # Only the people the small model was unsure about go to the larger one
+            retried = await self._analyze_links_batch([requests[i] for i in retry], self.LINK_FALLBACK_MODEL)
+            for i, result in zip(retry, retried):
+                results[i] = result
+        return results
+
+    async def _analyze_links_batch(self, requests: List[Dict], model: str) -> List[Dict]:
+        people = [
+            {"index": i, "target_name": request["query"], "search_results": request["links"]}
+            for i, request in enumerate(requests)
+        ]
+        prompt = f"""
+        ANALYZE SEARCH RESULTS FOR LINKEDIN PROFILES (BATCH)
+
+        **Objective:**
+        For each person below you are given their name and a JSON list of search engine results. For every person, find the single most relevant LinkedIn profile URL from that person's own results.
+
+        **People and their Search Results (JSON):**
+        ```json
+        {orjson.dumps(people).decode()}
+        ```
+
+        **Instructions:**
+        1.  Treat each person independently; only use the `search_results` listed with that person.
+        2.  The URL you return **must** start with `https://www.linkedin.com/in/`. If a result is a LinkedIn **post** (`/posts/`) that belongs to the person, transform it into the profile URL (e.g. `https://www.linkedin.com/posts/john-doe-12345_some-activity` becomes `https://www.linkedin.com/in/john-doe-12345`).
+        3.  Use the `title` of each result to confirm the person's identity. Prefer direct profile links (`/in/...`).
+
+        **Required Output Format:**
+        Return a single, valid JSON object with a `results` array containing exactly one entry per person:
+        {{
+          "results": [
+            {{"index": 0, "linkedin_url": "https://www.linkedin.com/in/john-doe-12345", "confidence": "high", "reasoning": "Title 'John Doe - Engineer at XYZ' matches the target."}}
+          ]
+        }}
+        - `index`: the person's index from the input.
+        - `linkedin_url`: the profile URL, or `null` if none is relevant.
+        - `confidence`: one of "high", "medium", "low", or "none".
+        - `reasoning`: a brief (1-2 sentence) explanation.
+        """
+
+        try:
+            response = await self.client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": _LINK_ANALYSIS_BATCH_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.1,
+            )
+
+            by_index = {}
+            for item in orjson.loads(response.choices[0].message.content).get("results", []):
+                try:
+                    by_index[int(item["index"])] = item
+                except (KeyError, TypeError, ValueError):
+                    continue
+            missing = {"linkedin_url": None, "confidence": "none",
+                       "reasoning": "No result returned for this person.", "error": "missing from batch response"}
+            return [by_index.get(i, dict(missing)) for i in range(len(requests))]
+
+        except Exception as e:
+            print(f"An unexpected error occurred during batched link analysis: {e}")
+            return [
+                {"linkedin_url": None, "confidence": "none", "reasoning": f"An exception occurred: {e}", "error": str(e)}
+                for _ in requests
+            ]
+
 # Example Test Function
 async def test_openai_service():
     """A simple function to test the OpenAI service."""
@@ -201,5 +536,4 @@ async def test_openai_service():
     print(json.dumps(analysis, indent=2))
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(test_openai_service()) 
\ No newline at end of file
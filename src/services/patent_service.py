@@ -1,59 +1,207 @@
 import asyncio
-from playwright.async_api import async_playwright, Page
+import functools
+import os
+import random
+import threading
+import httpx
+from playwright.async_api import Page
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import time
 import json
+import orjson
+from collections import OrderedDict
 from services.cache_service import CacheService
+from services.browser_pool import BrowserPool
+from utils import clean_inventors, is_placeholder_name
+
+def _parse_inventor_cell(inventors_text: str) -> List[str]:
+    # Inventor cell is "Last; First" (optionally followed by " et al."); reorder to "First Last"
+    match = _INVENTOR_CELL_RE.match(inventors_text)
+    inventor = f"{match['first']} {match['last']}" if match and match['first'] else (match['last'] if match else '')
+    
+    # Keep it only if it's a real full name, not "et al." or similar placeholder text
+    return [inventor] if not is_placeholder_name(inventor) and len(inventor.split()) >= 2 else []
+
+# Leading YYYY-MM-DD of an ISO timestamp such as '2009-01-06T00:00:00Z'
+_ISO_DATE_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})')
+
+def _table_date(value) -> Optional[str]:
+    """Reduce the XHR's publication timestamp to the YYYY-MM-DD date the results table shows"""
+    if not value:
+        return None
+    match = _ISO_DATE_RE.match(str(value))
+    return match.group(1) if match else str(value)
+
+def _is_search_response(response) -> bool:
+    """The ppubs search XHR: a JSON POST under /searches/"""
+    return (response.request.method == 'POST' and '/searches/' in response.url and response.ok
+            and 'json' in response.headers.get('content-type', ''))
+
+def _task_result(task: asyncio.Future):
+    """Result of a finished task, or None if it is pending, cancelled or failed (marking the error retrieved)"""
+    if not task.done() or task.cancelled() or task.exception() is not None:
+        return None
+    return task.result()
+
+# PatentsView PatentSearch API: one JSON round-trip instead of a headless-browser render.
+# Only the fields read by _parse_patentsview_patent are requested
+PATENTSVIEW_API_URL = "https://search.patentsview.org/api/v1/patent/"
+PATENTSVIEW_FIELDS = [
+    "patent_id",
+    "patent_title",
+    "patent_date",
+    "inventors.inventor_name_first",
+    "inventors.inventor_name_last",
+    "assignees.assignee_organization",
+]
+
+# Digit runs in a raw patent number, e.g. 'US10123456B2' -> ['10123456', '2']
+_DIGITS_RE = re.compile(r'\d+')
+
+# Fallback text-extraction patterns, compiled once
+_INVENTOR_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in (
+        r'\s([A-Z][A-Za-z,\s]+et al\.)\s+\d{4}-\d{2}-\d{2}',
+        r'Inventor[s]?:?\s*([^;]+(?:;[^;]+)*)',
+        r'(?:Inventor|Applicant)[s]?:?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
+    )
+)
+_TITLE_RE = re.compile(r'Preview PDF Text\s+(.*?)\s+[A-Z][a-z]+,')
+
+# First inventor in a USPTO results cell: "Last; First", "Last; First et al." or just "Name"
+_INVENTOR_CELL_RE = re.compile(r'^\s*(?P<last>[^;]+?)\s*(?:;\s*(?P<first>[^;]+?))?(?:\s+et al\.)?\s*(?:;|$)')
+
+# Patents kept in the in-process front cache before the least recently used is dropped
+PATENT_MEMO_SIZE = 1024
+
+# Canned demo data served when no real source returns the patent
+_MOCK_PATENTS = {
+    'US10123456B2': {
+        'title': 'Method and system for artificial intelligence-based data processing',
+        'inventors': ('John Smith', 'Sarah Johnson', 'Michael Chen'),
+        'assignee': 'Tech Innovations Inc.'
+    },
+    '10123456': {
+        'title': 'Method and system for artificial intelligence-based data processing',
+        'inventors': ('John Smith', 'Sarah Johnson', 'Michael Chen'),
+        'assignee': 'Tech Innovations Inc.'
+    },
+    'US9876543B1': {
+        'title': 'Advanced machine learning algorithm for pattern recognition',
+        'inventors': ('Emily Davis', 'Robert Wilson'),
+        'assignee': 'AI Research Corp'
+    },
+    '9876543': {
+        'title': 'Advanced machine learning algorithm for pattern recognition',
+        'inventors': ('Emily Davis', 'Robert Wilson'),
+        'assignee': 'AI Research Corp'
+    },
+    'US11234567A1': {
+        'title': 'Automated system for digital content analysis',
+        'inventors': ('David Brown', 'Lisa Martinez', 'James Taylor'),
+        'assignee': 'Digital Solutions LLC'
+    }
+}
+
+_MOCK_INVENTORS = (
+    ('John Doe', 'Jane Smith'),
+    ('Michael Johnson', 'Sarah Wilson', 'David Chen'),
+    ('Emily Rodriguez', 'James Taylor'),
+    ('Lisa Anderson', 'Robert Martinez', 'Jennifer Davis'),
+    ('Christopher Lee', 'Amanda Thompson'),
+)
+
+@functools.lru_cache(maxsize=1024)
+def _synthesize_mock_inventors(patent_number: str) -> Tuple[str, ...]:
+    # A generator seeded with the number gives consistent results for the same patent
+    return random.Random(patent_number).choice(_MOCK_INVENTORS)
+
+# Concurrent PatentsView requests per service, to stay inside the API's rate limit
+PATENTSVIEW_MAX_CONCURRENCY = 10
 
 class PatentService:
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            http_client: Optional shared HTTP client for API lookups; one is created if omitted
+        """
         self.uspto_search_url = "https://ppubs.uspto.gov/pubwebapp/static/pages/ppubsbasic.html"
+        # The API path is used only when a key is configured; Playwright remains the fallback
+        self.patentsview_api_key = os.getenv("PATENTSVIEW_API_KEY")
+        # Debug screenshots of USPTO result pages are only written when PATENT_DEBUG is set
+        self.debug = bool(os.environ.get('PATENT_DEBUG'))
+        self.http_client = http_client
+        self._owns_http_client = http_client is None
+        self._api_semaphore = asyncio.Semaphore(PATENTSVIEW_MAX_CONCURRENCY)
+        self.pool = None
         self.browser = None
-        self.context = None
         self.cache_service = CacheService()
+        # In-process LRU in front of cache_service, so repeat hits skip the backend.
+        # Entries are shared with callers, who treat patent data as read-only
+        self._memo: "OrderedDict[str, Dict]" = OrderedDict()
+        # get_cached_patent_data also runs in worker threads (see /export-excel)
+        self._memo_lock = threading.Lock()
+        # In-flight extractions by clean patent number, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Future] = {}
         
     async def __aenter__(self):
         """Async context manager entry"""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        self.context = await self.browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        )
+        if self.http_client is None:
+            self.http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+                timeout=httpx.Timeout(10.0)
+            )
+        user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        self.pool = BrowserPool(context_options={'user_agent': user_agent})
+        self.browser = await self.pool.start()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+        if self.pool:
+            await self.pool.close()
+        if self.http_client and self._owns_http_client:
+            await self.http_client.aclose()
     
     async def extract_patent_data(self, patent_number: str) -> Dict:
         """Extract patent data using Playwright automation with caching"""
+        clean_number = self._clean_patent_number(patent_number)
+        
+        # Coalesce concurrent requests for the same patent into one extraction.
+        # The shared task is shielded so a cancelled caller doesn't cancel it for the others.
+        inflight = self._inflight.get(clean_number)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._extract_patent_data(patent_number, clean_number))
+            self._inflight[clean_number] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(clean_number, None))
+        
+        return await asyncio.shield(inflight)
+    
+    async def _extract_patent_data(self, patent_number: str, clean_number: str) -> Dict:
         try:
-            clean_number = self._clean_patent_number(patent_number)
-            
             # Check cache first
-            cached_data = self.cache_service.get_patent_data(clean_number)
+            cached_data = self._get_cached(clean_number)
             if cached_data:
                 print(f"Using cached data for patent {clean_number}")
                 return cached_data
             
-            # Try USPTO search
-            data = await self._search_uspto_with_playwright(clean_number)
+            # Try the PatentsView API first, then the USPTO search page
+            data = await self._search_patentsview(clean_number)
+            if not data:
+                data = await self._search_uspto_with_playwright(clean_number)
             
             if not data or not data.get('inventors'):
                 # Fallback to mock data for demo
                 data = self._use_mock_data(clean_number)
             
+            # Store inventors already stripped of "et al." style placeholders so
+            # consumers reading the cache don't have to filter again
+            data['inventors'] = clean_inventors(data.get('inventors', []))
+            
             # Cache the result
-            self.cache_service.set_patent_data(clean_number, data)
+            self._set_cached(clean_number, data)
                 
             return data
             
@@ -61,111 +209,252 @@ class PatentService:
             print(f"Error extracting patent data: {e}")
             return self._use_mock_data(patent_number)
     
+    async def extract_patents_bulk(self, patent_numbers: List[str]) -> Dict[str, Dict]:
+        """
+        Extract several patents, fetching all uncached ones from PatentsView in a
+        single query. Numbers the API doesn't return go through extract_patent_data
+        (USPTO search, then mock data). Returns {patent_number: data} keyed by the
+        numbers as given.
+        """
+        clean_numbers = {number: self._clean_patent_number(number) for number in patent_numbers}
+        
+        found: Dict[str, Dict] = {}
+        uncached = []
+        for clean_number in dict.fromkeys(clean_numbers.values()):
+            cached_data = self._get_cached(clean_number)
+            if cached_data:
+                found[clean_number] = cached_data
+            else:
+                uncached.append(clean_number)
+        
+        for clean_number, data in (await self._search_patentsview_bulk(uncached)).items():
+            data['inventors'] = clean_inventors(data.get('inventors', []))
+            if data['inventors']:
+                self._set_cached(clean_number, data)
+                found[clean_number] = data
+        
+        missing = [clean_number for clean_number in uncached if clean_number not in found]
+        for clean_number, data in zip(missing, await asyncio.gather(*[self.extract_patent_data(n) for n in missing])):
+            found[clean_number] = data
+        
+        return {number: found[clean_number] for number, clean_number in clean_numbers.items()}
+    
+    def get_cached_patent_data(self, patent_number: str) -> Optional[Dict]:
+        """Return previously extracted patent data without touching the browser"""
+        return self._get_cached(self._clean_patent_number(patent_number))
+    
+    def _get_cached(self, clean_number: str) -> Optional[Dict]:
+        with self._memo_lock:
+            data = self._memo.get(clean_number)
+            if data is not None:
+                self._memo.move_to_end(clean_number)
+                return data
+        data = self.cache_service.get_patent_data(clean_number)
+        if data:
+            self._remember(clean_number, data)
+        return data
+    
+    def _set_cached(self, clean_number: str, data: Dict):
+        self.cache_service.set_patent_data(clean_number, data)
+        self._remember(clean_number, data)
+    
+    def _remember(self, clean_number: str, data: Dict):
+        with self._memo_lock:
+            self._memo[clean_number] = data
+            self._memo.move_to_end(clean_number)
+            if len(self._memo) > PATENT_MEMO_SIZE:
+                self._memo.popitem(last=False)
+    
+    def clear_memo(self):
+        """Drop the in-process front cache, e.g. after the backing cache was cleared"""
+        with self._memo_lock:
+            self._memo.clear()
+    
     def _clean_patent_number(self, patent_number: str) -> str:
         """Standardize patent number to its core numeric part for searching."""
+        number = patent_number.strip()
+        # Fast paths for the usual shapes: '10123456' and 'US10123456' / 'US10123456B2'
+        if number.isdecimal():
+            return number
+        if number[:2] == 'US':
+            end = 2
+            while end < len(number) and number[end].isdecimal():
+                end += 1
+            kind_code = number[end:]
+            if end - 2 > 1 and (not kind_code or (len(kind_code) <= 2 and kind_code[0].isalpha() and kind_code[1:].isdecimal())):
+                return number[2:end]
+        
         # Find all sequences of digits
-        numbers = re.findall(r'\\d+', patent_number)
+        numbers = _DIGITS_RE.findall(patent_number)
         if numbers:
             # Heuristic: The longest sequence of digits is usually the main patent number.
             # This handles cases like 'US10123456B2' -> '10123456'
             return max(numbers, key=len)
         # Fallback for cases with no digits, though unlikely for a patent number.
-        return patent_number.strip()
+        return number
     
-    async def _search_uspto_with_playwright(self, patent_number: str) -> Optional[Dict]:
-        """Use Playwright to search USPTO database"""
-        if not self.context:
-            raise Exception("Browser context not initialized. Use async context manager.")
+    async def _search_patentsview(self, patent_number: str) -> Optional[Dict]:
+        """Look the patent up through the PatentsView API; returns None on a miss or any failure"""
+        if not self.patentsview_api_key or not self.http_client:
+            return None
         
-        page = None
         try:
-            page = await self.context.new_page()
+            async with self._api_semaphore:
+                response = await self.http_client.post(
+                    PATENTSVIEW_API_URL,
+                    headers={"X-Api-Key": self.patentsview_api_key},
+                    json={"q": {"patent_id": patent_number}, "f": PATENTSVIEW_FIELDS, "o": {"size": 1}},
+                )
+            response.raise_for_status()
+            patents = orjson.loads(response.content).get("patents") or []
+            if not patents:
+                return None
             
-            # Navigate to USPTO basic search page
-            await page.goto(self.uspto_search_url, wait_until='domcontentloaded', timeout=30000)
-
-            # Use the specific ID selector from the provided HTML
-            search_input_selector = "#quickLookupTextInput"
-            await page.wait_for_selector(search_input_selector, timeout=15000)
-            search_input = page.locator(search_input_selector)
-            
-            # Clear and enter patent number
-            await search_input.fill(patent_number)
-            
-            # Use the specific ID selector for the search button
-            await page.locator("#quickLookupSearchBtn").click()
-            
-            # Wait for results to load, then scroll the results table into view
-            results_table_selector = "#searchResults"
-            await page.wait_for_selector(results_table_selector, timeout=15000)
-            await page.locator(results_table_selector).scroll_into_view_if_needed()
-            await page.wait_for_timeout(1000)  # Give time for rendering after scroll
-            
-            # Extract patent information from results page
-            patent_data = await self._extract_from_results_page(page, patent_number)
-            
-            await page.close()
-            return patent_data
+            return self._parse_patentsview_patent(patents[0], patent_number)
             
         except Exception as e:
-            print(f"Playwright search failed for '{patent_number}': {e}")
-            if page:
-                await page.screenshot(path=f'debug_screenshot_failed_{patent_number}.png')
+            # Schema changes or outages fall back to the browser path
+            print(f"PatentsView lookup failed for '{patent_number}': {e}")
             return None
     
-    async def _extract_from_results_page(self, page: Page, patent_number: str) -> Dict:
+    async def _search_patentsview_bulk(self, patent_numbers: List[str]) -> Dict[str, Dict]:
+        """Look up several patents with one PatentsView query; returns the hits by patent number"""
+        if not patent_numbers or not self.patentsview_api_key or not self.http_client:
+            return {}
+        
+        try:
+            async with self._api_semaphore:
+                response = await self.http_client.post(
+                    PATENTSVIEW_API_URL,
+                    headers={"X-Api-Key": self.patentsview_api_key},
+                    json={"q": {"patent_id": patent_numbers}, "f": PATENTSVIEW_FIELDS, "o": {"size": len(patent_numbers)}},
+                )
+            response.raise_for_status()
+            patents = orjson.loads(response.content).get("patents") or []
+            return {
+                str(patent.get("patent_id")): self._parse_patentsview_patent(patent, str(patent.get("patent_id")))
+                for patent in patents
+            }
+            
+        except Exception as e:
+            print(f"PatentsView bulk lookup failed for {len(patent_numbers)} patents: {e}")
+            return {}
+    
+    def _parse_patentsview_patent(self, patent: Dict, patent_number: str) -> Dict:
+        """Convert one PatentsView record into the dict shape the rest of the app uses"""
+        inventors = [
+            f"{inventor.get('inventor_name_first', '')} {inventor.get('inventor_name_last', '')}".strip()
+            for inventor in patent.get("inventors") or []
+        ]
+        assignees = patent.get("assignees") or []
+        
+        return {
+            'patent_number': patent_number,
+            'title': patent.get("patent_title", ''),
+            'inventors': inventors,
+            'publication_date': patent.get("patent_date"),
+            'assignee': assignees[0].get("assignee_organization") if assignees else None,
+            'source': 'patentsview_api',
+        }
+    
+    async def _search_uspto_with_playwright(self, patent_number: str) -> Optional[Dict]:
+        """Use Playwright to search USPTO database"""
+        if not self.pool:
+            raise Exception("Browser pool not initialized. Use async context manager.")
+        
+        # Each lookup checks out its own context and warm page, so concurrent
+        # extractions run in parallel without paying for page creation each time
+        async with self.pool.acquire_page() as page:
+            try:
+                # Use the specific ID selector from the provided HTML
+                search_input_selector = "#quickLookupTextInput"
+                # A pooled page still showing the search app runs the quick lookup again without
+                # a reload. Its previous results stay on screen until the app replaces them, so
+                # waits below key on this search's XHR or on a row showing the searched number
+                warm = page.url.startswith(self.uspto_search_url) and await page.locator(search_input_selector).count() > 0
+                if not warm:
+                    # Navigate to USPTO basic search page
+                    await page.goto(self.uspto_search_url, wait_until='domcontentloaded', timeout=30000)
+                    await page.wait_for_selector(search_input_selector, timeout=15000)
+                search_input = page.locator(search_input_selector)
+                
+                # Clear and enter patent number
+                await search_input.fill(patent_number)
+                
+                # Use the specific ID selector for the search button. The app's search XHR
+                # carries the same fields as the results table, so listen for it while the
+                # table renders and skip the DOM scrape when it can be used directly
+                results_table_selector = "#searchResults"
+                result_row = self._result_row(page, patent_number)
+                search_response = asyncio.ensure_future(
+                    page.wait_for_event('response', predicate=_is_search_response, timeout=15000)
+                )
+                row_shown = None
+                try:
+                    await page.locator("#quickLookupSearchBtn").click()
+                    row_shown = asyncio.ensure_future(result_row.wait_for(state='visible', timeout=15000))
+                    await asyncio.wait({search_response, row_shown}, return_when=asyncio.FIRST_COMPLETED)
+                    data = await self._read_search_response(_task_result(search_response), patent_number)
+                finally:
+                    for task in (search_response, row_shown):
+                        if task:
+                            task.cancel()
+                            _task_result(task)
+                if data:
+                    return data
+                
+                # Wait for results to load, then scroll the results table into view
+                await page.wait_for_selector(results_table_selector, timeout=15000)
+                await page.locator(results_table_selector).scroll_into_view_if_needed()
+                
+                # Extract patent information from results page. A "No records found" notice
+                # on a reused page may be left over from the previous lookup, so it only
+                # counts on a freshly loaded one (the XHR reports empty results either way)
+                return await self._extract_from_results_page(page, patent_number, trust_no_records=not warm)
+                
+            except Exception as e:
+                print(f"Playwright search failed for '{patent_number}': {e}")
+                if self.debug:
+                    await page.screenshot(path=f'debug_screenshot_failed_{patent_number}.jpg', type='jpeg', quality=60, full_page=False)
+                return None
+    
+    def _result_row(self, page: Page, patent_number: str):
+        """The results table row for the searched number (rows show it as e.g. 'US-7654321-B2')"""
+        return page.locator("#searchResults tbody tr", has_text=patent_number).first
+    
+    async def _extract_from_results_page(self, page: Page, patent_number: str, trust_no_records: bool = True) -> Dict:
         """Extract patent details from USPTO results page"""
         try:
-            # First, check if the page indicates that no records were found.
-            no_records_locator = page.locator("text='No records found'")
+            # Wait for either the "no records" notice or the searched number's row, whichever shows up first
+            first_row = self._result_row(page, patent_number)
+            first_row_task = asyncio.ensure_future(first_row.wait_for(timeout=10000))
+            no_records_task = (
+                asyncio.ensure_future(page.locator("text='No records found'").wait_for(timeout=10000))
+                if trust_no_records else None
+            )
+            waits = {task for task in (no_records_task, first_row_task) if task}
             try:
-                await no_records_locator.wait_for(timeout=2000)
-                print(f"No records found for patent {patent_number}.")
-                return {
-                    'patent_number': patent_number,
-                    'title': 'No results found',
-                    'inventors': [],
-                    'publication_date': None,
-                    'source': 'uspto_playwright',
-                }
-            except Exception:
-                # This is expected if results are found.
-                pass
-
-            results_table_selector = "#searchResults"
-            await page.wait_for_selector(results_table_selector, timeout=5000)
+                done, _ = await asyncio.wait(waits, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for task in waits:
+                    task.cancel()
+            errors = {task: task.exception() for task in done}
             
-            # Find the first result row in the table body
-            first_row = page.locator(f"{results_table_selector} tbody tr:first-child")
-            await first_row.wait_for(timeout=5000)
+            if errors.get(no_records_task, True) is None:
+                return self._no_records_result(patent_number)
+            if errors.get(first_row_task, True) is not None:
+                # Neither appeared in time; surface the wait's timeout
+                raise next(error for error in errors.values() if error is not None)
             
             # Extract data from the cells of the first row based on column order
-            cells = first_row.locator("td")
-            title = await cells.nth(3).inner_text()
-            inventors_text = await cells.nth(4).inner_text()
-            publication_date = await cells.nth(5).inner_text()
-
-            # Clean up inventor text, assuming "Last; First" format
-            inventors = []
-            has_et_al = 'et al.' in inventors_text
-            cleaned_inventors_text = inventors_text.replace(' et al.', '').strip()
-            parts = [p.strip() for p in cleaned_inventors_text.split(';') if p.strip()]
-            
-            if len(parts) >= 2:
-                inventors.append(f"{parts[1]} {parts[0]}") # Reorder to "First Last"
-            elif parts:
-                inventors.append(parts[0])
+            title, inventors_text, publication_date = await first_row.evaluate(
+                "row => { const c = row.querySelectorAll('td'); return [c[3].innerText, c[4].innerText, c[5].innerText]; }"
+            )
 
-            # Filter out any remaining "et al." or similar placeholder text
-            filtered_inventors = []
-            for inventor in inventors:
-                inventor_clean = inventor.strip()
-                if inventor_clean.lower() not in ['et al.', 'et al', 'and others', 'others'] and len(inventor_clean.split()) >= 2:
-                    filtered_inventors.append(inventor_clean)
-            
-            inventors = filtered_inventors
+            inventors = _parse_inventor_cell(inventors_text)
 
-            await page.screenshot(path=f'debug_screenshot_{patent_number}.png')
+            if self.debug:
+                await page.screenshot(path=f'debug_screenshot_{patent_number}.png')
             
             return {
                 'patent_number': patent_number,
@@ -185,16 +474,56 @@ class PatentService:
                 'error': str(e)
             }
     
+    async def _read_search_response(self, response, patent_number: str) -> Optional[Dict]:
+        """Patent data from the captured search XHR, or None to fall back to the results table"""
+        if response is None:
+            return None
+        try:
+            return self._parse_search_payload(await response.json(), patent_number)
+        except Exception as e:
+            print(f"USPTO search response not usable for '{patent_number}', reading the table: {e}")
+            return None
+    
+    def _no_records_result(self, patent_number: str) -> Dict:
+        print(f"No records found for patent {patent_number}.")
+        return {
+            'patent_number': patent_number,
+            'title': 'No results found',
+            'inventors': [],
+            'publication_date': None,
+            'source': 'uspto_playwright',
+        }
+    
+    def _parse_search_payload(self, payload, patent_number: str) -> Optional[Dict]:
+        """
+        Build the result from the search XHR's JSON. Returns None when the payload
+        doesn't have the expected shape or lists no inventors, so the caller reads the table instead.
+        """
+        docs = payload.get('patents') if isinstance(payload, dict) else None
+        if docs == []:
+            # The search itself reports no match; a reused page's notice can't be trusted
+            return self._no_records_result(patent_number)
+        if not docs or not isinstance(docs[0], dict) or not docs[0].get('inventionTitle'):
+            return None
+        
+        doc = docs[0]
+        inventors = _parse_inventor_cell(doc.get('inventorsShort') or '')
+        if not inventors:
+            # Unknown inventor field; the table scrape will find them
+            return None
+        return {
+            'patent_number': patent_number,
+            'title': doc['inventionTitle'],
+            'inventors': inventors,
+            'publication_date': _table_date(doc.get('datePublished')),
+            'source': 'uspto_playwright',
+        }
+    
     def _extract_inventors_from_text(self, text: str) -> List[str]:
         """This function is no longer the primary method for extraction but is kept as a potential fallback."""
         inventors = []
-        patterns = [
-            r'\s([A-Z][A-Za-z,\s]+et al\.)\s+\d{4}-\d{2}-\d{2}',
-            r'Inventor[s]?:?\s*([^;]+(?:;[^;]+)*)',
-            r'(?:Inventor|Applicant)[s]?:?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
-        ]
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _INVENTOR_PATTERNS:
+            matches = pattern.findall(text)
             for m in matches:
                 # Basic cleaning, can be improved
                 cleaned_name = m.replace('et al.', '').strip()
@@ -204,7 +533,7 @@ class PatentService:
     
     def _extract_title_from_text(self, text: str) -> str:
         """This function is no longer the primary method for extraction but is kept as a potential fallback."""
-        match = re.search(r'Preview PDF Text\s+(.*?)\s+[A-Z][a-z]+,', text)
+        match = _TITLE_RE.search(text)
         if match:
             return match.group(1).strip()
         
@@ -212,54 +541,14 @@ class PatentService:
     
     def _use_mock_data(self, patent_number: str) -> Dict:
         """Fallback to realistic mock data for demonstration"""
-        mock_patents = {
-            'US10123456B2': {
-                'title': 'Method and system for artificial intelligence-based data processing',
-                'inventors': ['John Smith', 'Sarah Johnson', 'Michael Chen'],
-                'assignee': 'Tech Innovations Inc.'
-            },
-            '10123456': {
-                'title': 'Method and system for artificial intelligence-based data processing',
-                'inventors': ['John Smith', 'Sarah Johnson', 'Michael Chen'],
-                'assignee': 'Tech Innovations Inc.'
-            },
-            'US9876543B1': {
-                'title': 'Advanced machine learning algorithm for pattern recognition',
-                'inventors': ['Emily Davis', 'Robert Wilson'],
-                'assignee': 'AI Research Corp'
-            },
-            '9876543': {
-                'title': 'Advanced machine learning algorithm for pattern recognition',
-                'inventors': ['Emily Davis', 'Robert Wilson'],
-                'assignee': 'AI Research Corp'
-            },
-            'US11234567A1': {
-                'title': 'Automated system for digital content analysis',
-                'inventors': ['David Brown', 'Lisa Martinez', 'James Taylor'],
-                'assignee': 'Digital Solutions LLC'
-            }
-        }
-        
         # Return mock data or generate realistic fake data
-        if patent_number in mock_patents:
-            data = mock_patents[patent_number].copy()
+        if patent_number in _MOCK_PATENTS:
+            data = _MOCK_PATENTS[patent_number].copy()
+            data['inventors'] = list(data['inventors'])
         else:
-            # Generate realistic mock data for any patent number
-            inventor_names = [
-                ['John Doe', 'Jane Smith'],
-                ['Michael Johnson', 'Sarah Wilson', 'David Chen'],
-                ['Emily Rodriguez', 'James Taylor'],
-                ['Lisa Anderson', 'Robert Martinez', 'Jennifer Davis'],
-                ['Christopher Lee', 'Amanda Thompson']
-            ]
-            
-            import random
-            random.seed(hash(patent_number))  # Consistent results for same patent
-            selected_inventors = random.choice(inventor_names)
-            
             data = {
                 'title': f'Advanced Technical System and Method for Innovation ({patent_number})',
-                'inventors': selected_inventors,
+                'inventors': list(_synthesize_mock_inventors(patent_number)),
                 'assignee': 'Innovation Technologies LLC'
             }
         
@@ -273,16 +562,40 @@ class PatentService:
 
 # Synchronous wrapper for easy testing
 class PatentServiceSync:
+    """
+    Blocking facade over PatentService. One event loop and one started service
+    (browser included) are kept for the wrapper's lifetime, so repeated lookups
+    don't relaunch Chromium. Call close() when done, or use it as a context manager.
+    """
+    
     def __init__(self):
-        self.service = PatentService()
+        self._loop = asyncio.new_event_loop()
+        self.service: Optional[PatentService] = None
+    
+    def _ensure_started(self) -> PatentService:
+        if self.service is None:
+            self.service = self._loop.run_until_complete(PatentService().__aenter__())
+        return self.service
     
     def extract_patent_data(self, patent_number: str) -> Dict:
         """Synchronous wrapper for patent extraction"""
-        async def _extract():
-            async with PatentService() as service:
-                return await service.extract_patent_data(patent_number)
-        
-        return asyncio.run(_extract())
+        service = self._ensure_started()
+        return self._loop.run_until_complete(service.extract_patent_data(patent_number))
+    
+    def close(self):
+        """Shut the service (and its browser) down and close the event loop"""
+        if self._loop.is_closed():
+            return
+        if self.service is not None:
+            self._loop.run_until_complete(self.service.__aexit__(None, None, None))
+            self.service = None
+        self._loop.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
 
 # Test function
@@ -296,9 +609,10 @@ async def test_patent_extraction():
     print("-" * 120)
 
     async with PatentService() as service:
-        for patent in test_patents:
-            data = await service.extract_patent_data(patent)
-            
+        # One PatentsView query for the whole list; misses fall back to concurrent browser lookups
+        results = await service.extract_patents_bulk(test_patents)
+        
+        for patent, data in results.items():
             inventors_str = ", ".join(data.get('inventors', []))
             title_str = data.get('title', 'N/A')
             source_str = data.get('source', 'unknown')
@@ -312,9 +626,9 @@ async def test_patent_extraction():
 
 # Synchronous test for quick validation
 def test_sync():
-    service = PatentServiceSync()
-    result = service.extract_patent_data("US10123456B2")
-    print("Sync test result:", result)
+    with PatentServiceSync() as service:
+        result = service.extract_patent_data("US10123456B2")
+        print("Sync test result:", result)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,47 @@
+# src/services/rate_limiter.py - Async token-bucket rate limiter
+
+import asyncio
+import time
+from typing import Optional
+
+class AsyncRateLimiter:
+    """
+    Allows bursts of up to `max_burst` acquisitions (default `max_rate`) and
+    refills at `max_rate / time_period` per second, so callers only wait once
+    the budget is actually spent. The bucket starts full. Waiters are served
+    in arrival order.
+
+    Usage:
+        limiter = AsyncRateLimiter(30, 60, max_burst=3)
+        async with limiter:
+            await make_request()
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60, max_burst: Optional[float] = None):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self.max_burst = max_rate if max_burst is None else max_burst
+        self._refill_rate = max_rate / time_period
+        self._tokens = float(self.max_burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.max_burst, self._tokens + (now - self._updated_at) * self._refill_rate)
+        self._updated_at = now
+
+    async def acquire(self):
+        """Take one token, waiting for the bucket to refill if it is empty"""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._refill_rate)
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
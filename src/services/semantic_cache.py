@@ -0,0 +1,115 @@
+# src/services/semantic_cache.py - Embedding-based cache for near-duplicate LLM prompts
+
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class SemanticCache:
+    """
+    In-process semantic cache in front of the OpenAI analysis calls.
+
+    Prompts are embedded and compared by cosine similarity against previously
+    answered prompts; a hit above the threshold returns the stored response
+    instead of calling the LLM again. Vectors are kept L2-normalized in a single
+    matrix, so a lookup is one matrix-vector product (exact inner-product search).
+    """
+
+    def __init__(self, embed_fn: Callable[[List[str]], Awaitable[List[List[float]]]],
+                 threshold: float = 0.93, max_entries: int = 4096):
+        """
+        Args:
+            embed_fn: Async callable turning a list of texts into a list of embeddings
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Oldest entries are evicted beyond this size
+        """
+        self._embed_fn = embed_fn
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._vectors: Optional[np.ndarray] = None
+        self._values: List[Dict] = []
+        self.hits = 0
+        self.misses = 0
+
+    async def embed(self, text: str) -> Optional[np.ndarray]:
+        """Embed a single prompt; returns None if the embedding call fails"""
+        vectors = await self.embed_many([text])
+        return vectors[0]
+
+    async def embed_many(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """Embed several prompts with one API call"""
+        try:
+            embeddings = await self._embed_fn(texts)
+        except Exception as e:
+            logger.warning("Semantic cache embedding failed: %s", e)
+            return [None] * len(texts)
+
+        vectors = []
+        for embedding in embeddings:
+            vector = np.asarray(embedding, dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            vectors.append(vector / norm if norm else None)
+        return vectors
+
+    def _similarities(self, vector: np.ndarray) -> np.ndarray:
+        if self._vectors is None:
+            return np.empty(0, dtype=np.float32)
+        return self._vectors @ vector
+
+    def lookup(self, vector: Optional[np.ndarray]) -> Optional[Dict]:
+        """Return the stored response closest to the vector if it clears the threshold"""
+        if vector is None:
+            return None
+
+        similarities = self._similarities(vector)
+        if similarities.size:
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                self.hits += 1
+                return self._values[best]
+
+        self.misses += 1
+        return None
+
+    def store(self, vector: Optional[np.ndarray], value: Dict) -> None:
+        """Remember a response under the given prompt embedding"""
+        if vector is None:
+            return
+
+        if self._vectors is None:
+            self._vectors = vector[np.newaxis, :]
+        else:
+            self._vectors = np.vstack([self._vectors, vector])
+        self._values.append(value)
+
+        overflow = len(self._values) - self.max_entries
+        if overflow > 0:
+            self._vectors = self._vectors[overflow:]
+            self._values = self._values[overflow:]
+
+    def invalidate(self, vector: Optional[np.ndarray]) -> int:
+        """Drop every entry inside the similarity sphere around the vector"""
+        if vector is None or self._vectors is None:
+            return 0
+
+        keep = self._similarities(vector) < self.threshold
+        removed = int((~keep).sum())
+        if removed:
+            self._values = [value for value, kept in zip(self._values, keep) if kept]
+            self._vectors = self._vectors[keep] if keep.any() else None
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._vectors = None
+        self._values = []
+
+    def get_stats(self) -> Dict:
+        """Entry count and hit/miss counters"""
+        return {
+            "entries": len(self._values),
+            "threshold": self.threshold,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,30 @@
+# src/utils.py - Small helpers shared by the API and the services
+
+import re
+from typing import List, Optional
+from rapidfuzz import fuzz, process, utils as fuzz_utils
+
+# Non-person entries that show up in inventor lists ("Smith; John et al.")
+_PLACEHOLDER_RE = re.compile(r'^(et al\.?|and others|others)$', re.IGNORECASE)
+
+def is_placeholder_name(name: str) -> bool:
+    """True for "et al." and similar placeholder text that is not an inventor"""
+    return bool(_PLACEHOLDER_RE.match(name.strip()))
+
+def clean_inventors(names: List[str]) -> List[str]:
+    """Strip inventor names and drop empty or placeholder entries"""
+    return [name.strip() for name in names if name and not _PLACEHOLDER_RE.match(name.strip())]
+
+def best_name_match(name: str, candidates: List[str], score_cutoff: float = 90) -> Optional[int]:
+    """
+    Index of the candidate that is the same person ("John Smith" ~ "Smith, John A."), or None.
+    Word order and small spelling differences are tolerated, but a name that is only part
+    of another ("John" vs "John Smith", "John Smith" vs "John Smith Jr") is not a match.
+    """
+    match = process.extractOne(
+        name, candidates,
+        scorer=fuzz.token_sort_ratio,
+        processor=fuzz_utils.default_process,
+        score_cutoff=score_cutoff
+    )
+    return match[2] if match else None
@@ -340,29 +340,29 @@ async function analyzeInventor(patentNumber, patentTitle, rowIndex) {
         const analysisResults = [];
         const errors = [];
         
-        for (const inventorName of validInventors) {
-            try {
-                const response = await fetch('/analyze-inventor', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ patent_number: patentNumber, patent_title: patentTitle, inventor_name: inventorName })
-                });
-                
-                const result = await response.json();
-                
-                if (response.ok) {
-                    if (result.data && result.data.name) {
-                        displayAiAnalysis(result.data, patentNumber);
+        try {
+            // Analyze all inventors of this patent in one batched request
+            const response = await fetch('/analyze-inventors-batch', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ patent_number: patentNumber, patent_title: patentTitle, inventor_names: validInventors })
+            });
+            
+            const result = await response.json();
+            
+            if (response.ok) {
+                for (const inventorResult of result.results) {
+                    if (inventorResult.data && inventorResult.data.name) {
+                        displayAiAnalysis(inventorResult.data, patentNumber);
                     } else {
-                        console.error("Failed to display AI analysis: response data is incomplete.", result);
-                        showError(`Analysis for ${inventorName} succeeded, but the returned data was incomplete.`);
+                        errors.push(`${inventorResult.inventor_name}: ${inventorResult.error || 'returned data was incomplete'}`);
                     }
-                } else {
-                    showError(`Failed to analyze ${inventorName}: ${result.detail || 'Unknown error'}`);
                 }
-            } catch (error) {
-                errors.push(`${inventorName}: ${error.message}`);
+            } else {
+                showError(`Failed to analyze inventors: ${result.detail || 'Unknown error'}`);
             }
+        } catch (error) {
+            errors.push(error.message);
         }
         
         // Display analysis results if any
@@ -0,0 +1,6 @@
+# tests/conftest.py - Make the app's top-level packages (services, utils, models) importable
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
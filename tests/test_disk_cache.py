@@ -0,0 +1,41 @@
+# tests/test_disk_cache.py - SQLite cache with per-entry TTL
+
+import asyncio
+
+import pytest
+
+from services.disk_cache import DiskCache, cache_key
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite"))
+    yield cache
+    cache.close()
+
+def test_values_round_trip_until_they_expire(cache):
+    cache.set("fresh", {"urls": ["a", "b"]}, ttl=60)
+    cache.set("stale", {"urls": []}, ttl=-1)
+    assert cache.get("fresh") == {"urls": ["a", "b"]}
+    assert cache.get("stale") is None
+    assert cache.get("missing") is None
+
+def test_async_helpers(cache):
+    async def round_trip():
+        await cache.aset("key", [1, 2], ttl=60)
+        return await cache.aget("key")
+    assert asyncio.run(round_trip()) == [1, 2]
+
+def test_clear_only_touches_its_own_table(cache, tmp_path):
+    other = DiskCache(str(tmp_path / "cache.sqlite"), table="profile_finder")
+    try:
+        cache.set("key", 1, ttl=60)
+        other.set("key", 2, ttl=60)
+        other.clear()
+        assert other.get("key") is None
+        assert cache.get("key") == 1
+    finally:
+        other.close()
+
+def test_cache_key_is_stable_and_separates_parts():
+    assert cache_key("a", "b") == cache_key("a", "b")
+    assert cache_key("ab", "") != cache_key("a", "b")
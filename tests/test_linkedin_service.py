@@ -0,0 +1,21 @@
+# tests/test_linkedin_service.py - Profile slug prefilter of LinkedInProfileFinder
+
+from services.linkedin_service import SLUG_ACCEPT_SCORE, SLUG_MIN_SCORE, _slug_similarity
+
+def test_slug_with_every_name_part_is_accepted():
+    assert _slug_similarity('john-doe-12345', 'john doe') >= SLUG_ACCEPT_SCORE
+    assert _slug_similarity('doe-john', 'john a doe') >= SLUG_ACCEPT_SCORE
+    assert _slug_similarity('johndoe', 'john doe') >= SLUG_ACCEPT_SCORE
+
+def test_short_name_parts_do_not_match_inside_other_words():
+    assert _slug_similarity('william-wangston', 'li wang') <= SLUG_MIN_SCORE
+    assert _slug_similarity('nguyen-andrews', 'an ng') == 0
+
+def test_prefix_match_is_not_enough_to_accept():
+    score = _slug_similarity('john-smithson', 'john smith')
+    assert SLUG_MIN_SCORE < score < SLUG_ACCEPT_SCORE
+
+def test_unjudgeable_slugs():
+    assert _slug_similarity('ACoAAB12345', 'john doe') is None
+    assert _slug_similarity('jose-garcia', 'josé garcía') is None
+    assert _slug_similarity('12345', 'john doe') is None
@@ -0,0 +1,30 @@
+# tests/test_openai_service.py - Pure helpers of the OpenAI service
+
+import pytest
+
+from services.openai_service import _JSONArrayStream, _classify_tech_domain
+
+@pytest.mark.parametrize("title, expected", [
+    ("distributed database system", "Software/IT"),
+    ("medical imaging apparatus", "Biotech/Medical"),
+    ("gaming controller", "Hardware/Gaming"),
+    ("medical software", "Software/IT"),
+    ("garden hose", "General"),
+])
+def test_classify_tech_domain_first_rule_wins(title, expected):
+    assert _classify_tech_domain(title) == expected
+
+def test_json_array_stream_yields_items_as_they_close():
+    parser = _JSONArrayStream("inventors")
+    assert parser.feed('{"summary": "x", "inv') == []
+    assert parser.feed('entors": [{"name": "A') == []
+    assert parser.feed('nn ]"}, {"name"') == [{"name": "Ann ]"}]
+    assert parser.feed(': "Bo"}') == [{"name": "Bo"}]
+    assert not parser.done
+    assert parser.feed(' ]}') == []
+    assert parser.done
+
+def test_json_array_stream_ignores_other_keys_and_empty_arrays():
+    parser = _JSONArrayStream("inventors")
+    assert parser.feed('{"other": [{"name": "X"}], "inventors": []}') == []
+    assert parser.done
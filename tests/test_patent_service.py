@@ -0,0 +1,56 @@
+# tests/test_patent_service.py - Patent number and USPTO result parsing
+
+import pytest
+
+# PatentService's cache backend is not part of every checkout
+pytest.importorskip("services.cache_service")
+
+from services.patent_service import PatentService, _parse_inventor_cell
+
+@pytest.fixture
+def service():
+    # The parsers don't touch the browser, API client or cache, so skip __init__
+    return PatentService.__new__(PatentService)
+
+@pytest.mark.parametrize("raw, expected", [
+    ("10123456", "10123456"),
+    (" US10123456 ", "10123456"),
+    ("US10123456B2", "10123456"),
+    ("US7654321B1", "7654321"),
+    ("US 7654321 B1", "7654321"),
+    ("EP1234567A1", "1234567"),
+    ("D123456", "123456"),
+])
+def test_clean_patent_number(service, raw, expected):
+    assert service._clean_patent_number(raw) == expected
+
+@pytest.mark.parametrize("cell, expected", [
+    ("Smith; John", ["John Smith"]),
+    ("Smith; John et al.", ["John Smith"]),
+    ("Smith; John A.; Doe; Jane", ["John A. Smith"]),
+    ("et al.", []),
+    ("Madonna", []),
+    ("", []),
+])
+def test_parse_inventor_cell(cell, expected):
+    assert _parse_inventor_cell(cell) == expected
+
+def test_parse_search_payload(service):
+    payload = {'patents': [{
+        'inventionTitle': 'Widget',
+        'inventorsShort': 'Smith; John et al.',
+        'datePublished': '2009-01-06T00:00:00Z',
+    }]}
+    result = service._parse_search_payload(payload, '7654321')
+    assert result['title'] == 'Widget'
+    assert result['inventors'] == ['John Smith']
+    assert result['publication_date'] == '2009-01-06'
+
+def test_parse_search_payload_falls_back_to_the_table(service):
+    assert service._parse_search_payload({'patents': [{'inventionTitle': 'Widget'}]}, '1') is None
+    assert service._parse_search_payload({'unexpected': True}, '1') is None
+    assert service._parse_search_payload([], '1') is None
+
+def test_parse_search_payload_reports_no_records(service):
+    result = service._parse_search_payload({'patents': []}, '1')
+    assert result['title'] == 'No results found' and result['inventors'] == []
@@ -0,0 +1,27 @@
+# tests/test_rate_limiter.py - Token-bucket pacing
+
+import asyncio
+import time
+
+from services.rate_limiter import AsyncRateLimiter
+
+async def _acquire_times(limiter: AsyncRateLimiter, count: int):
+    start = time.monotonic()
+    times = []
+    for _ in range(count):
+        async with limiter:
+            times.append(time.monotonic() - start)
+    return times
+
+def test_burst_is_capped_and_then_paced():
+    # 20 per second sustained (one token every 50ms), at most 2 back to back
+    limiter = AsyncRateLimiter(max_rate=20, time_period=1, max_burst=2)
+    times = asyncio.run(_acquire_times(limiter, 4))
+    assert times[1] < 0.03
+    assert times[2] >= 0.04
+    assert times[3] - times[2] >= 0.04
+
+def test_burst_defaults_to_the_rate():
+    limiter = AsyncRateLimiter(max_rate=5, time_period=60)
+    times = asyncio.run(_acquire_times(limiter, 5))
+    assert times[-1] < 0.05
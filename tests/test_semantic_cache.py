@@ -0,0 +1,46 @@
+# tests/test_semantic_cache.py - Nearest-neighbour lookup of the semantic cache
+
+import asyncio
+
+import numpy as np
+
+from services.semantic_cache import SemanticCache
+
+def _unit(*values):
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+def _cache(**kwargs):
+    async def embed(texts):
+        raise RuntimeError("not used")
+    return SemanticCache(embed, **kwargs)
+
+def test_lookup_returns_the_nearest_entry_above_the_threshold():
+    cache = _cache(threshold=0.9)
+    cache.store(_unit(1, 0, 0), {"id": "x"})
+    cache.store(_unit(0, 1, 0), {"id": "y"})
+    assert cache.lookup(_unit(1, 0.1, 0)) == {"id": "x"}
+    assert cache.lookup(_unit(1, 1, 0)) is None  # cos 0.71 to both
+    assert cache.lookup(None) is None
+    assert cache.get_stats()["hits"] == 1
+
+def test_oldest_entries_are_evicted():
+    cache = _cache(threshold=0.99, max_entries=2)
+    for i, axis in enumerate(np.eye(3, dtype=np.float32)):
+        cache.store(axis, {"id": i})
+    assert cache.lookup(np.eye(3, dtype=np.float32)[0]) is None
+    assert cache.lookup(np.eye(3, dtype=np.float32)[2]) == {"id": 2}
+
+def test_invalidate_and_clear():
+    cache = _cache(threshold=0.9)
+    cache.store(_unit(1, 0), {"id": "x"})
+    cache.store(_unit(0, 1), {"id": "y"})
+    assert cache.invalidate(_unit(1, 0.05)) == 1
+    assert cache.lookup(_unit(1, 0)) is None
+    assert cache.lookup(_unit(0, 1)) == {"id": "y"}
+    cache.clear()
+    assert cache.lookup(_unit(0, 1)) is None
+
+def test_failed_embedding_gives_no_vector():
+    vectors = asyncio.run(_cache().embed_many(["a", "b"]))
+    assert vectors == [None, None]
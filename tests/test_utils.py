@@ -0,0 +1,24 @@
+# tests/test_utils.py - Inventor name helpers
+
+from utils import best_name_match, clean_inventors, is_placeholder_name
+
+def test_best_name_match_tolerates_order_and_initials():
+    assert best_name_match("John Smith", ["Jane Doe", "Smith, John A."]) == 1
+    assert best_name_match("Jon Smith", ["John Smith"]) == 0
+
+def test_best_name_match_rejects_partial_names():
+    assert best_name_match("John", ["John Smith"]) is None
+    assert best_name_match("John Smith", ["John"]) is None
+    assert best_name_match("John Smith", ["John Smith Jr"]) is None
+
+def test_best_name_match_rejects_other_people():
+    assert best_name_match("John Smith", ["John Smythe-Jones", "Mary Smith"]) is None
+    assert best_name_match("John Smith", []) is None
+
+def test_clean_inventors_drops_placeholders_and_blanks():
+    assert clean_inventors([" John Smith ", "et al.", "", "Others", "Jane Doe"]) == ["John Smith", "Jane Doe"]
+
+def test_is_placeholder_name():
+    assert is_placeholder_name(" et al ")
+    assert is_placeholder_name("and others")
+    assert not is_placeholder_name("Al Etal")